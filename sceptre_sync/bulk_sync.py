@@ -6,32 +6,426 @@ Extension of the parameter sync utility to handle bulk operations
 across multiple files and directories.
 """
 
-import argparse
 import os
 import sys
 import re
-import glob
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from contextlib import contextmanager, nullcontext, redirect_stderr, redirect_stdout
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from .param_sync import ParamSync
-from .common import calculate_total_changes
+from .sync_state import DEFAULT_STATE_FILE, SyncState, file_stamp
+from .common import calculate_total_changes, compile_glob, enable_debug_logging, run_in_pool
+
+# Sceptre environment directory segment, e.g. "/di-production/"
+_ENV_RE = re.compile(r'/(di-[^/]+)/')
+
+# Glob metacharacters
+_GLOB_MAGIC = re.compile(r'[*?\[]')
+
+
+def _has_magic(segment: str) -> bool:
+    """Return True if a path segment contains glob metacharacters."""
+    return _GLOB_MAGIC.search(segment) is not None
+
+
+def _scandir(path: str) -> List[os.DirEntry]:
+    """List a directory, treating unreadable or missing directories as empty."""
+    try:
+        with os.scandir(path or os.curdir) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _list_names(directories: Set[str]) -> Dict[str, Set[str]]:
+    """Map each directory to the set of entry names it contains."""
+    return {
+        directory: {entry.name for entry in _scandir(directory)}
+        for directory in directories
+    }
+
+
+def _walk_dirs(base: str) -> Iterator[str]:
+    """
+    Yield base and every non-hidden directory below it.
+
+    Symlinked directories are not descended into, so cyclic links can't
+    trap a ``**`` walk.
+    """
+    yield base
+    for entry in _scandir(base):
+        if entry.name.startswith('.'):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_dirs(os.path.join(base, entry.name))
+
+
+def _glob_segments(base: str, segments: Tuple[str, ...],
+                   dir_only: bool = False) -> Iterator[str]:
+    """
+    Match the remaining pattern segments below base.
+
+    Literal segments are resolved with a direct lookup, wildcard segments
+    with a single scandir of the current directory and ``**`` with a
+    recursive directory walk. With dir_only (the pattern ended in a
+    separator) only directories match, and they are returned with a
+    trailing separator, as glob does.
+    """
+    segment, rest = segments[0], segments[1:]
+
+    if segment == '**':
+        if rest:
+            for directory in _walk_dirs(base):
+                yield from _glob_segments(directory, rest, dir_only)
+        elif dir_only:
+            for directory in _walk_dirs(base):
+                yield os.path.join(directory, '')
+        else:
+            # A trailing ** matches every file and directory below base
+            yield os.path.join(base, '')
+            for directory in _walk_dirs(base):
+                for entry in _scandir(directory):
+                    if not entry.name.startswith('.'):
+                        yield os.path.join(directory, entry.name)
+        return
+
+    if not _has_magic(segment):
+        path = os.path.join(base, segment)
+        if rest:
+            if os.path.isdir(path):
+                yield from _glob_segments(path, rest, dir_only)
+        elif dir_only:
+            if os.path.isdir(path):
+                yield os.path.join(path, '')
+        elif os.path.lexists(path):
+            yield path
+        return
+
+    regex = compile_glob(segment)
+    include_hidden = segment.startswith('.')
+    for entry in _scandir(base):
+        name = entry.name
+        if name.startswith('.') and not include_hidden:
+            continue
+        if not regex.match(os.path.normcase(name)):
+            continue
+        if rest:
+            if entry.is_dir():
+                yield from _glob_segments(os.path.join(base, name), rest, dir_only)
+        elif dir_only:
+            if entry.is_dir():
+                yield os.path.join(base, name, '')
+        else:
+            yield os.path.join(base, name)
+
+
+def _scandir_glob(pattern: str) -> List[str]:
+    """
+    Expand a glob pattern (with ``**`` recursion) using os.scandir.
+
+    The literal directory prefix of the pattern is used as-is instead of
+    being enumerated, so only the wildcard part of the tree is scanned.
+    Unlike glob, ``**`` does not descend into symlinked directories.
+
+    Args:
+        pattern: Glob pattern to expand
+
+    Returns:
+        List of matching paths
+    """
+    # A pattern without wildcards names a single path: one lstat, no walk
+    if not _has_magic(pattern):
+        return [pattern] if os.path.lexists(pattern) else []
+
+    if os.altsep:
+        pattern = pattern.replace(os.altsep, os.sep)
+    parts = pattern.split(os.sep)
+    first_magic = next(i for i, part in enumerate(parts) if _has_magic(part))
+
+    prefix = parts[:first_magic]
+    base = os.sep.join(prefix)
+    if prefix == ['']:
+        base = os.sep
+    if base and not os.path.isdir(base):
+        return []
+
+    # A trailing separator restricts the matches to directories
+    dir_only = parts[-1] == ''
+    segments = tuple(part for part in parts[first_magic:] if part)
+    return list(_glob_segments(base, segments, dir_only))
+
+
+def _prefetch_file(path: str) -> None:
+    """Ask the OS to start reading a file into the page cache."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            os.read(fd, 65536)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _prefetch_files(paths: List[str]) -> ThreadPoolExecutor:
+    """
+    Prefetch files into the page cache in the background.
+
+    Returns immediately; the reads overlap with the (serial) diff loop so
+    later files are already cached by the time they are parsed. The caller
+    must shut the executor down (e.g. by using it as a context manager), so
+    no prefetch threads outlive the run.
+
+    Args:
+        paths: Paths of the files to prefetch
+
+    Returns:
+        The executor running the prefetch
+    """
+    executor = ThreadPoolExecutor(max_workers=8)
+    for path in paths:
+        executor.submit(_prefetch_file, path)
+    return executor
+
+
+class _BufferedWriter:
+    """Collects writes in memory and passes them on in large chunks."""
+
+    def __init__(self, stream: IO[str], limit: int):
+        self.stream = stream
+        self.limit = limit
+        self.parts: List[str] = []
+        self.size = 0
+
+    def write(self, text: str) -> int:
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.limit:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if self.parts:
+            self.stream.write(''.join(self.parts))
+            self.parts.clear()
+            self.size = 0
+        self.stream.flush()
+
+
+class _FlushingWriter:
+    """Passes writes on to a stream, flushing a buffered writer first."""
+
+    def __init__(self, stream: IO[str], buffered: _BufferedWriter):
+        self.stream = stream
+        self.buffered = buffered
+
+    def write(self, text: str) -> int:
+        self.buffered.flush()
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+@contextmanager
+def _buffered_stdout(limit: int = 65536) -> Iterator[None]:
+    """
+    Buffer everything printed inside the block, writing it out every limit
+    characters instead of once per print.
+
+    Per-pair progress output otherwise costs a write (and, when stdout is
+    line buffered, a flush) per line - thousands of them on a large run.
+    Writes to stderr flush the buffer first, so the two streams stay in
+    order when they share a terminal. Only use this when nothing inside
+    the block prompts the user.
+    """
+    writer = _BufferedWriter(sys.stdout, limit)
+    try:
+        with redirect_stdout(writer), redirect_stderr(_FlushingWriter(sys.stderr, writer)):
+            yield
+    finally:
+        writer.flush()
+
+
+def _diff_pair(param_sync: ParamSync, source_file: str, target_file: str,
+               sync_template: bool, filter_spec: Optional[str],
+               filter_pred: Optional[Callable[..., bool]] = None) -> Optional[Tuple]:
+    """
+    Compute the dry-run diff for one file pair.
+
+    Args:
+        param_sync: ParamSync instance holding the sync rules
+        source_file: Path to the source YAML file
+        target_file: Path to the target YAML file
+        sync_template: Whether to sync the template section
+        filter_spec: Filter specification to apply (field_path:substring)
+        filter_pred: filter_spec already compiled with ParamSync.compile_filter
+
+    Returns:
+        (diff, documents) as returned by ParamSync.diff_files, or None if no
+        sync parameters are defined for the source file
+    """
+    print(f"\nProcessing: {source_file} -> {target_file}")
+
+    # Check if we have sync rules (new multi-key approach)
+    sync_rules = param_sync.get_sync_rules(source_file)
+
+    if sync_rules:
+        # New multi-key sync with static values support!
+        print(f"Using multi-key sync rules for {source_file}")
+
+        # Generate diff using the multi-key sync
+        return param_sync.diff_files(
+            source_file, target_file,
+            sync_template=sync_template,
+            filter_spec=filter_spec,
+            filter_pred=filter_pred
+        )
+
+    # Fallback to old single-key approach for backward compatibility
+    # Determine parameters to sync based on source file
+    params_to_sync = param_sync.get_sync_params(source_file)
+
+    if not params_to_sync:
+        print(f"No sync parameters defined for {source_file}, skipping.")
+        return None
+
+    # Determine parameters to delete based on source file
+    params_to_delete = param_sync.get_delete_params(source_file)
+
+    # Determine if template should be synced
+    should_sync_template = (
+        sync_template or param_sync.should_sync_template(source_file)
+    )
+
+    # Generate diff using old single-key approach
+    return param_sync.diff_files(
+        source_file, target_file, params_to_sync, params_to_delete,
+        sync_template=should_sync_template,
+        filter_spec=filter_spec, filter_pred=filter_pred
+    )
+
+
+# ParamSync instance and compiled filter owned by a worker process,
+# built once by _init_worker
+_worker_param_sync: Optional[ParamSync] = None
+_worker_filter_pred: Optional[Callable[..., bool]] = None
+
+
+def _init_worker(config: Dict, filter_spec: Optional[str] = None) -> None:
+    """Set up the parent's sync rules and compile the filter once per worker process."""
+    global _worker_param_sync, _worker_filter_pred
+    _worker_param_sync = ParamSync()
+    _worker_param_sync.config = config
+    _worker_filter_pred = (
+        _worker_param_sync.compile_filter(filter_spec) if filter_spec else None
+    )
+
+
+def _diff_pair_in_worker(args: Tuple[str, str, bool, Optional[str], bool]) -> Optional[Tuple]:
+    """
+    Run _diff_pair in a worker process.
+
+    The parsed documents are only sent back when the parent may apply the
+    diff.
+    """
+    source_file, target_file, sync_template, filter_spec, keep_documents = args
+    result = _diff_pair(_worker_param_sync, source_file, target_file,
+                        sync_template, filter_spec, _worker_filter_pred)
+    if result is not None and not keep_documents:
+        result = (result[0], None)
+    return result
+
+
+@dataclass
+class SyncSummary:
+    """
+    Totals for a bulk sync run.
+
+    Also reads like the dict sync_bulk used to return: summary['key'],
+    summary.get(), 'key' in summary, keys(), items() and comparison with a
+    dict all work. Use as_dict() where a real dict is needed, e.g. for
+    json.dumps.
+    """
+
+    __slots__ = ('total_files', 'changed_files', 'total_changes',
+                 'filtered_files', 'file_changes')
+
+    total_files: int
+    changed_files: int
+    total_changes: int
+    filtered_files: int
+    file_changes: Dict[str, int]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, getattr(self, key)) for key in self.__slots__]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the totals as a plain dict, in the old return format."""
+        return dict(self.items())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SyncSummary):
+            return self.items() == other.items()
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        return NotImplemented
 
 
 class BulkParamSync:
     """Class for handling bulk parameter synchronization operations."""
 
-    def __init__(self, config_file: Optional[str] = None):
+    # Minimum number of file pairs before diffs are computed in a process pool
+    parallel_threshold = 32
+
+    def __init__(self, config_file: Optional[str] = None,
+                 max_workers: Optional[int] = None, verbose: bool = True,
+                 state_file: Optional[str] = None):
         """
         Initialize the BulkParamSync utility.
 
         Args:
             config_file: Path to the configuration file defining sync rules
+            max_workers: Worker processes for non-interactive runs
+                (defaults to the CPU count; 1 disables the process pool)
+            verbose: List every source file whose target file is missing
+                (otherwise only their count is reported)
+            state_file: JSON file remembering pairs that were in sync, so
+                unchanged pairs are skipped on later runs (disabled if None)
         """
+        self.config_file = config_file
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self.state = SyncState(state_file) if state_file else None
         self.param_sync = ParamSync(config_file)
 
     def find_matching_files(self, pattern: str) -> List[str]:
         """
-        Find all files matching the given pattern using glob.
+        Find all files matching the given pattern.
+
+        ``**`` recurses into subdirectories. Only directories below the
+        pattern's literal prefix are scanned.
 
         Args:
             pattern: Glob pattern to match files
@@ -39,8 +433,7 @@ class BulkParamSync:
         Returns:
             List of file paths matching the pattern
         """
-        # Use glob directly which is more efficient and safer
-        return glob.glob(pattern, recursive=True)
+        return _scandir_glob(pattern)
 
     def generate_file_pairs(self, source_pattern: str,
                             target_pattern: str) -> List[Tuple[str, str]]:
@@ -58,8 +451,8 @@ class BulkParamSync:
             List of (source_file, target_file) tuples
         """
         # Extract environment names from patterns
-        source_env_match = re.search(r'/(di-[^/]+)/', source_pattern)
-        target_env_match = re.search(r'/(di-[^/]+)/', target_pattern)
+        source_env_match = _ENV_RE.search(source_pattern)
+        target_env_match = _ENV_RE.search(target_pattern)
 
         # Find all source files
         source_files = self.find_matching_files(source_pattern)
@@ -81,15 +474,33 @@ class BulkParamSync:
             print(f"Source environment: {source_env}")
             print(f"Target environment: {target_env}")
 
-            for source_file in source_files:
-                # Create target file path by replacing environment name
-                target_file = source_file.replace(f"/{source_env}/", f"/{target_env}/")
-
-                # Check if target file exists
-                if os.path.exists(target_file):
+            # Create target file paths by replacing environment name
+            source_segment = f"/{source_env}/"
+            target_segment = f"/{target_env}/"
+            candidates = [
+                (source_file, source_file.replace(source_segment, target_segment))
+                for source_file in source_files
+            ]
+
+            # Check target existence with one directory listing per target
+            # directory instead of one stat per file
+            existing = _list_names({os.path.dirname(target) for _, target in candidates})
+
+            missing = []
+            for source_file, target_file in candidates:
+                directory, name = os.path.split(target_file)
+                if name in existing[directory]:
                     file_pairs.append((source_file, target_file))
                 else:
-                    print(f"Target file not found: {target_file}")
+                    missing.append(target_file)
+
+            if missing:
+                if self.verbose:
+                    print("\n".join(f"Target file not found: {target_file}"
+                                    for target_file in missing))
+                else:
+                    print(f"{len(missing)} target files not found "
+                          "(use --verbose to list them)")
         else:
             # For non-environment patterns, try direct mapping
             target_files = self.find_matching_files(target_pattern)
@@ -104,21 +515,61 @@ class BulkParamSync:
             if len(source_files) == 1 and len(target_files) == 1:
                 file_pairs.append((source_files[0], target_files[0]))
             else:
-                # Try to match by filename
+                # Try to match by filename; the first target with a given
+                # filename wins, as with the previous linear scan
+                basename = os.path.basename
+                target_by_name = {}
+                for target_file in target_files:
+                    target_by_name.setdefault(basename(target_file), target_file)
+
                 for source_file in source_files:
-                    source_filename = os.path.basename(source_file)
-                    for target_file in target_files:
-                        target_filename = os.path.basename(target_file)
-                        if source_filename == target_filename:
-                            file_pairs.append((source_file, target_file))
-                            break
+                    target_file = target_by_name.get(basename(source_file))
+                    if target_file is not None:
+                        file_pairs.append((source_file, target_file))
 
         return file_pairs
 
+    def _diff_pairs(self, file_pairs: List[Tuple[str, str]], sync_template: bool,
+                    filter_spec: Optional[str], parallel: bool,
+                    keep_documents: bool = True) -> Iterator[Optional[Tuple]]:
+        """
+        Yield the dry-run diff and parsed documents for each file pair, in order.
+
+        Diffing is CPU-bound YAML parsing, so when no prompts are needed the
+        pairs are spread across a process pool; otherwise they are diffed
+        lazily in this process, interleaved with the prompts.
+
+        Args:
+            file_pairs: List of (source_file, target_file) tuples
+            sync_template: Whether to sync the template section
+            filter_spec: Filter specification to apply (field_path:substring)
+            parallel: Whether to use a process pool
+            keep_documents: Whether the parsed documents are needed to apply
+                the diffs (if not, workers don't send them back)
+
+        Yields:
+            (diff, documents) for each pair, or None if the pair has no sync
+            parameters
+        """
+        if not parallel:
+            filter_pred = (
+                self.param_sync.compile_filter(filter_spec) if filter_spec else None
+            )
+            for source_file, target_file in file_pairs:
+                yield _diff_pair(self.param_sync, source_file, target_file,
+                                 sync_template, filter_spec, filter_pred)
+            return
+
+        tasks = [(source_file, target_file, sync_template, filter_spec, keep_documents)
+                 for source_file, target_file in file_pairs]
+        yield from run_in_pool(_diff_pair_in_worker, tasks, max_workers=self.max_workers,
+                               initializer=_init_worker,
+                               initargs=(self.param_sync.config, filter_spec))
+
     def sync_bulk(self, source_pattern: str, target_pattern: str,
                   dry_run: bool = False, interactive: bool = True,
                   sync_template: bool = False, yes_to_all: bool = False,
-                  filter_spec: Optional[str] = None) -> Dict:
+                  filter_spec: Optional[str] = None) -> SyncSummary:
         """
         Synchronize parameters across multiple file pairs.
 
@@ -132,7 +583,7 @@ class BulkParamSync:
             filter_spec: Filter specification to apply (field_path:substring)
 
         Returns:
-            Dict containing summary of changes
+            SyncSummary of the changes
         """
         print(f"Source pattern: {source_pattern}")
         print(f"Target pattern: {target_pattern}")
@@ -145,111 +596,129 @@ class BulkParamSync:
 
         if not file_pairs:
             print("No matching file pairs found.")
-            return {'total_files': 0, 'changed_files': 0, 'total_changes': 0}
+            return SyncSummary(0, 0, 0, 0, {})
 
         print(f"Found {len(file_pairs)} file pairs to process.")
 
-        summary = {
-            'total_files': len(file_pairs),
-            'changed_files': 0,
-            'total_changes': 0,
-            'file_changes': {},
-            'filtered_files': 0
-        }
-
-        for source_file, target_file in file_pairs:
-            print(f"\nProcessing: {source_file} -> {target_file}")
-
-            # Check if we have sync rules (new multi-key approach)
-            sync_rules = self.param_sync.get_sync_rules(source_file)
-            
-            if sync_rules:
-                # New multi-key sync with static values support!
-                print(f"Using multi-key sync rules for {source_file}")
-                
-                # Generate diff using the multi-key sync
-                diff = self.param_sync.sync_parameters(
-                    source_file, target_file,
-                    dry_run=True, 
-                    sync_template=sync_template,
-                    filter_spec=filter_spec
-                )
-            else:
-                # Fallback to old single-key approach for backward compatibility
-                # Determine parameters to sync based on source file
-                params_to_sync = self.param_sync.get_sync_params(source_file)
+        summary = SyncSummary(total_files=len(file_pairs), changed_files=0,
+                              total_changes=0, filtered_files=0, file_changes={})
+
+        # Skip pairs that were in sync last time and haven't changed since
+        signature = self._state_signature(sync_template, filter_spec)
+        if self.state is not None:
+            pending = [pair for pair in file_pairs
+                       if not self.state.is_current(*pair, signature)]
+            if len(pending) < len(file_pairs):
+                print(f"Skipping {len(file_pairs) - len(pending)} file pairs "
+                      "unchanged since they were last in sync.")
+            file_pairs = pending
+
+        # Batch the per-pair output unless we'll be prompting between pairs
+        prompts = interactive and not yes_to_all and not dry_run
+        try:
+            with nullcontext() if prompts else _buffered_stdout():
+                self._sync_pairs(file_pairs, summary, dry_run, interactive,
+                                 sync_template, yes_to_all, filter_spec, signature)
+        finally:
+            if self.state is not None:
+                self.state.save()
+
+        return summary
+
+    def _state_signature(self, sync_template: bool, filter_spec: Optional[str]) -> str:
+        """Describe the settings a diff depends on besides the files themselves."""
+        config_stamp = file_stamp(self.config_file) if self.config_file else None
+        return repr((config_stamp, sync_template, filter_spec))
 
-                if not params_to_sync:
-                    print(f"No sync parameters defined for {source_file}, skipping.")
+    def _sync_pairs(self, file_pairs: List[Tuple[str, str]], summary: SyncSummary,
+                    dry_run: bool, interactive: bool, sync_template: bool,
+                    yes_to_all: bool, filter_spec: Optional[str],
+                    signature: str) -> None:
+        """
+        Diff, report and (optionally) apply each file pair, updating summary.
+
+        Args:
+            file_pairs: List of (source_file, target_file) tuples
+            summary: Summary to update in place
+            dry_run: If True, only show changes without applying them
+            interactive: If True, prompt for confirmation before each file pair
+            sync_template: Whether to sync the template section
+            yes_to_all: If True, automatically apply all changes without prompting
+            filter_spec: Filter specification to apply (field_path:substring)
+            signature: Settings signature recorded for pairs left in sync
+        """
+        parallel = (
+            len(file_pairs) >= self.parallel_threshold
+            and self.max_workers != 1
+            and not (interactive and not yes_to_all and not dry_run)
+        )
+        prefetch = nullcontext()
+        if not parallel:
+            # Warm the page cache for every file while the first pairs are
+            # diffed. Not done before a process pool starts: forking with the
+            # prefetch threads still running is unsafe, and each worker reads
+            # its own files anyway. The threads are joined before returning,
+            # so a later run in this process can fork safely.
+            prefetch = _prefetch_files(list(dict.fromkeys(path for pair in file_pairs
+                                                          for path in pair)))
+
+        with prefetch:
+            results = self._diff_pairs(file_pairs, sync_template, filter_spec, parallel,
+                                       keep_documents=not dry_run)
+
+            for (source_file, target_file), result in zip(file_pairs, results):
+                # No sync parameters defined for this source file
+                if result is None:
                     continue
+                diff, documents = result
 
-                # Determine parameters to delete based on source file
-                params_to_delete = self.param_sync.get_delete_params(source_file)
-
-                # Determine if template should be synced
-                should_sync_template = (
-                    sync_template or self.param_sync.should_sync_template(source_file)
-                )
-
-                # Generate diff using old single-key approach
-                diff = self.param_sync.sync_parameters(
-                    source_file, target_file, params_to_sync, params_to_delete,
-                    dry_run=True, sync_template=should_sync_template,
-                    filter_spec=filter_spec
-                )
-
-            # Check if file was filtered out
-            if not diff and filter_spec:
-                summary['filtered_files'] += 1
-                continue
-
-            # Print diff
-            self.param_sync.print_diff(diff)
-
-            total_changes = calculate_total_changes(diff)
-
-            if total_changes == 0:
-                print("No changes needed.")
-                continue
-
-            # Determine whether to apply changes
-            proceed = True
-
-            # If not in yes_to_all mode and interactive mode is on, prompt for confirmation
-            if not yes_to_all and interactive and not dry_run:
-                response = input("\nApply these changes? [y/N] ").lower()
-                proceed = response in ('y', 'yes')
-
-            # Apply changes if confirmed or yes_to_all
-            if proceed and not dry_run:
-                if sync_rules:
-                    # Apply with multi-key sync
-                    self.param_sync.sync_parameters(
-                        source_file, target_file,
-                        dry_run=False,
-                        sync_template=sync_template,
-                        filter_spec=filter_spec
-                    )
-                else:
-                    # Apply with old single-key approach
-                    self.param_sync.sync_parameters(
-                        source_file, target_file, params_to_sync, params_to_delete,
-                        dry_run=False, sync_template=should_sync_template,
-                        filter_spec=filter_spec
-                    )
-                print("Changes applied.")
-                summary['changed_files'] += 1
-                summary['total_changes'] += total_changes
-                summary['file_changes'][target_file] = total_changes
+                # Check if file was filtered out
+                if not diff and filter_spec:
+                    summary.filtered_files += 1
+                    continue
 
-        return summary
+                # Print diff
+                self.param_sync.print_diff(diff)
 
+                total_changes = calculate_total_changes(diff)
 
-def main():
-    """Main entry point for the bulk sync command line interface."""
-    parser = argparse.ArgumentParser(
-        description="Bulk synchronize parameters between YAML configuration files"
-    )
+                if total_changes == 0:
+                    print("No changes needed.")
+                    if self.state is not None:
+                        self.state.record(source_file, target_file, signature)
+                    continue
+
+                # Determine whether to apply changes
+                proceed = True
+
+                # If not in yes_to_all mode and interactive mode is on, prompt for confirmation
+                if not yes_to_all and interactive and not dry_run:
+                    response = input("\nApply these changes? [y/N] ").lower()
+                    proceed = response in ('y', 'yes')
+
+                # Apply changes if confirmed or yes_to_all, reusing the diff and
+                # documents from above rather than reading the files a second time
+                if proceed and not dry_run:
+                    self.param_sync.apply_diff(source_file, target_file, diff,
+                                               documents=documents)
+                    print("Changes applied.")
+                    summary.changed_files += 1
+                    summary.total_changes += total_changes
+                    summary.file_changes[target_file] = total_changes
+                    if self.state is not None:
+                        self.state.record(source_file, target_file, signature)
+
+
+def add_bulk_arguments(parser: Any) -> None:
+    """
+    Add the bulk sync options to an argument parser.
+
+    Shared by this module's entry point and the ``bulk`` subcommand of the
+    unified CLI, so the two accept the same flags with the same meaning.
+
+    Args:
+        parser: argparse parser (or subparser) to add the options to
+    """
     parser.add_argument("--source-pattern", "-s", required=True,
                         help="Pattern for source files")
     parser.add_argument("--target-pattern", "-t", required=True,
@@ -268,11 +737,38 @@ def main():
         "--filter", "-f",
         help="Filter by field value (format: field.path:substring)"
     )
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="List every source file whose target file is missing "
+                             "and explain filter decisions")
+    parser.add_argument("--workers", "-w", type=int,
+                        help="Worker processes for runs without prompts "
+                             "(default: one per CPU; 1 diffs in this process)")
+    parser.add_argument(
+        "--state-file", nargs="?", const=DEFAULT_STATE_FILE,
+        help="Skip file pairs unchanged since they were last in sync, "
+             f"tracked in this file (default: {DEFAULT_STATE_FILE})"
+    )
+
+
+def main():
+    """Main entry point for the bulk sync command line interface."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Bulk synchronize parameters between YAML configuration files"
+    )
+    add_bulk_arguments(parser)
 
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.verbose:
+        enable_debug_logging()
 
     # Initialize BulkParamSync
-    bulk_sync = BulkParamSync(args.config)
+    bulk_sync = BulkParamSync(args.config, max_workers=args.workers,
+                              verbose=args.verbose, state_file=args.state_file)
 
     # Perform bulk sync operation
     summary = bulk_sync.sync_bulk(
@@ -287,11 +783,11 @@ def main():
 
     # Print summary
     print("\nSummary:")
-    print(f"  Files processed: {summary['total_files']}")
-    if 'filtered_files' in summary and summary['filtered_files'] > 0:
-        print(f"  Files filtered out: {summary['filtered_files']}")
-    print(f"  Files changed: {summary['changed_files']}")
-    print(f"  Total changes: {summary['total_changes']}")
+    print(f"  Files processed: {summary.total_files}")
+    if summary.filtered_files > 0:
+        print(f"  Files filtered out: {summary.filtered_files}")
+    print(f"  Files changed: {summary.changed_files}")
+    print(f"  Total changes: {summary.total_changes}")
 
     return 0
 
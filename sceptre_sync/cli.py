@@ -10,8 +10,8 @@ import sys
 from typing import List, Optional
 
 from .param_sync import ParamSync
-from .bulk_sync import BulkParamSync
-from .common import format_diff_summary
+from .bulk_sync import BulkParamSync, add_bulk_arguments
+from .common import enable_debug_logging, format_diff_summary
 
 
 def main(args: Optional[List[str]] = None) -> int:
@@ -48,22 +48,7 @@ def main(args: Optional[List[str]] = None) -> int:
 
     # Bulk sync command
     bulk_parser = subparsers.add_parser("bulk", help="Sync parameters across multiple files")
-    bulk_parser.add_argument("--source-pattern", "-s", required=True,
-                             help="Pattern for source files")
-    bulk_parser.add_argument("--target-pattern", "-t", required=True,
-                             help="Pattern for target files")
-    bulk_parser.add_argument("--config", "-c", required=True,
-                             help="Configuration file defining sync rules")
-    bulk_parser.add_argument("--dry-run", "-d", action="store_true",
-                             help="Show changes without applying them")
-    bulk_parser.add_argument("--non-interactive", "-n", action="store_true",
-                             help="Apply all changes without prompting")
-    bulk_parser.add_argument("--sync-template", "-T", action="store_true",
-                             help="Sync the template section")
-    bulk_parser.add_argument("--yes", "-y", action="store_true",
-                             help="Automatically apply all changes without prompting")
-    bulk_parser.add_argument("--filter", "-f",
-                             help="Filter by field value (format: field.path:substring)")
+    add_bulk_arguments(bulk_parser)
 
     # Parse arguments
     parsed_args = parser.parse_args(args)
@@ -99,8 +84,16 @@ def main(args: Optional[List[str]] = None) -> int:
                     print(f"\n{summary}")
 
     elif parsed_args.command == "bulk":
+        if parsed_args.workers is not None and parsed_args.workers < 1:
+            bulk_parser.error("--workers must be at least 1")
+
+        if parsed_args.verbose:
+            enable_debug_logging()
+
         # Call bulk sync
-        bulk_sync = BulkParamSync(parsed_args.config)
+        bulk_sync = BulkParamSync(parsed_args.config, max_workers=parsed_args.workers,
+                                  verbose=parsed_args.verbose,
+                                  state_file=parsed_args.state_file)
         summary = bulk_sync.sync_bulk(
             parsed_args.source_pattern,
             parsed_args.target_pattern,
@@ -5,7 +5,104 @@ Shared functionality between param_sync and bulk_sync modules.
 Because DRY is not just a principle, it's a way of life.
 """
 
-from typing import Dict
+import fnmatch
+import functools
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Tuple
+
+# Types whose equality agrees with comparing their str() forms
+_SCALARS = (str, int)
+# Types whose str() forms must differ when their lengths do
+_CONTAINERS = (dict, list)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_glob(pattern: str) -> Pattern[str]:
+    """
+    Compile a glob pattern into a regex, reusing the result for repeat patterns.
+
+    Args:
+        pattern: Glob pattern (fnmatch syntax)
+
+    Returns:
+        Compiled regex matching the whole (case-normalized) string
+    """
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def glob_match(name: str, pattern: str) -> bool:
+    """
+    Check a name against a glob pattern, like fnmatch.fnmatch.
+
+    Args:
+        name: The string to test, typically a file path
+        pattern: Glob pattern (fnmatch syntax)
+
+    Returns:
+        True if the name matches the pattern
+    """
+    return compile_glob(pattern).match(os.path.normcase(name)) is not None
+
+
+def values_differ(source_value: Any, target_value: Any) -> bool:
+    """
+    Check whether two YAML values differ, comparing their string forms.
+
+    Values are compared as strings so that e.g. 80 and "80" count as the
+    same. Most parameters are plain scalars of the same type, which are
+    compared directly instead of building two new strings; round-trip maps
+    and lists compare about as fast via str() as via ==, and their == would
+    ignore key order, so they keep the string comparison - unless their
+    lengths already tell them apart.
+
+    Args:
+        source_value: Value from the source file
+        target_value: Value from the target file
+
+    Returns:
+        True if the values differ
+    """
+    if type(source_value) is type(target_value):
+        if isinstance(source_value, _SCALARS):
+            return source_value != target_value
+        if isinstance(source_value, _CONTAINERS) and len(source_value) != len(target_value):
+            return True
+    return str(source_value) != str(target_value)
+
+
+def count_changes(diff: Dict) -> Tuple[int, int, int, int]:
+    """
+    Count the changes in a diff in a single pass.
+
+    A single-key (legacy) diff is treated as a multi-key diff with one
+    implicit key, so both formats share the same counting code.
+
+    Args:
+        diff: Dict containing added, modified, deleted, and template changes
+
+    Returns:
+        Tuple of (additions, modifications, deletions, template changes)
+    """
+    key_diffs = [
+        key_diff for key, key_diff in diff.items()
+        if key != 'template' and isinstance(key_diff, dict) and 'added' in key_diff
+    ]
+    if not key_diffs:
+        # Single-key format (legacy)
+        key_diffs = [diff]
+
+    additions = sum(len(key_diff.get('added', ())) for key_diff in key_diffs)
+    modifications = sum(len(key_diff.get('modified', ())) for key_diff in key_diffs)
+    deletions = sum(len(key_diff.get('deleted', ())) for key_diff in key_diffs)
+    template_changes = 1 if diff.get('template') else 0
+
+    return additions, modifications, deletions, template_changes
 
 
 def calculate_total_changes(diff: Dict) -> int:
@@ -18,29 +115,7 @@ def calculate_total_changes(diff: Dict) -> int:
     Returns:
         Total count of all changes
     """
-    # Check if this is a multi-key diff
-    is_multi_key = any(isinstance(v, dict) and 'added' in v for k, v in diff.items() if k != 'template')
-    
-    if is_multi_key:
-        # Multi-key format: sum changes across all keys
-        total = 0
-        for key, key_diff in diff.items():
-            if key == 'template':
-                if key_diff:
-                    total += 1
-            elif isinstance(key_diff, dict):
-                total += len(key_diff.get('added', {}))
-                total += len(key_diff.get('modified', {}))
-                total += len(key_diff.get('deleted', {}))
-        return total
-    else:
-        # Single-key format (legacy)
-        total = len(diff.get('added', {}))
-        total += len(diff.get('modified', {}))
-        total += len(diff.get('deleted', {}))
-        if diff.get('template'):
-            total += 1
-        return total
+    return sum(count_changes(diff))
 
 
 def format_diff_summary(diff: Dict, dry_run: bool = False) -> str:
@@ -57,41 +132,112 @@ def format_diff_summary(diff: Dict, dry_run: bool = False) -> str:
     if not diff:
         return ""
 
-    total_changes = calculate_total_changes(diff)
+    additions, modifications, deletions, template_changes = count_changes(diff)
+    total_changes = additions + modifications + deletions + template_changes
     if total_changes == 0:
         return ""
 
     action = "Would apply" if dry_run else "Applied"
-    
-    # Check if this is a multi-key diff
-    is_multi_key = any(isinstance(v, dict) and 'added' in v for k, v in diff.items() if k != 'template')
-    
-    if is_multi_key:
-        # Multi-key format: count changes across all keys
-        additions = 0
-        modifications = 0
-        deletions = 0
-        template_changes = 1 if diff.get('template') else 0
-        
-        for key, key_diff in diff.items():
-            if key == 'template':
-                continue
-            elif isinstance(key_diff, dict):
-                additions += len(key_diff.get('added', {}))
-                modifications += len(key_diff.get('modified', {}))
-                deletions += len(key_diff.get('deleted', {}))
-        
-        return (f"{action} {total_changes} changes "
-                f"({additions} additions, "
-                f"{modifications} modifications, "
-                f"{deletions} deletions, "
-                f"{template_changes} template changes)")
-    else:
-        # Single-key format (legacy)
-        template_changes = 1 if diff.get('template') else 0
-        
-        return (f"{action} {total_changes} changes "
-                f"({len(diff.get('added', {}))} additions, "
-                f"{len(diff.get('modified', {}))} modifications, "
-                f"{len(diff.get('deleted', {}))} deletions, "
-                f"{template_changes} template changes)")
+
+    return (f"{action} {total_changes} changes "
+            f"({additions} additions, "
+            f"{modifications} modifications, "
+            f"{deletions} deletions, "
+            f"{template_changes} template changes)")
+
+
+class _CurrentStdoutHandler(logging.StreamHandler):
+    """Log handler that writes to whatever sys.stdout is when a record is emitted."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def enable_debug_logging() -> None:
+    """
+    Print sceptre_sync debug messages (e.g. filter decisions) to stdout.
+
+    sys.stdout is looked up for every message rather than bound once, so
+    debug lines go through the same buffered or captured stream as the
+    print() output around them and stay in order with it. Calling this
+    more than once adds no further handlers.
+    """
+    package_logger = logging.getLogger('sceptre_sync')
+    package_logger.setLevel(logging.DEBUG)
+    if not any(isinstance(handler, _CurrentStdoutHandler)
+               for handler in package_logger.handlers):
+        handler = _CurrentStdoutHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        package_logger.addHandler(handler)
+
+
+def _init_pool_worker(debug: bool, initializer: Optional[Callable[..., None]],
+                      initargs: Tuple) -> None:
+    """Turn on debug logging if the parent has it, then run the caller's initializer."""
+    if debug:
+        enable_debug_logging()
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _call_capturing_output(func: Callable[[Any], Any], task: Any) -> Tuple:
+    """
+    Call func in a worker process, capturing its console output.
+
+    Output is returned rather than printed so the parent can replay it in
+    task order. Exceptions (including SystemExit from load errors) are
+    returned too, so the parent can re-raise them after the output.
+    """
+    out, err = StringIO(), StringIO()
+    result, error = None, None
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            result = func(task)
+        except BaseException as e:
+            error = e
+    return result, out.getvalue(), err.getvalue(), error
+
+
+def run_in_pool(func: Callable[[Any], Any], tasks: List[Any],
+                max_workers: Optional[int] = None,
+                initializer: Optional[Callable[..., None]] = None,
+                initargs: Tuple = ()) -> Iterator[Any]:
+    """
+    Map a function over tasks in a process pool, replaying output in order.
+
+    Each worker runs initializer(*initargs) once, with sceptre_sync debug
+    logging enabled if it is enabled here. Whatever func prints in a
+    worker is written to this process's stdout/stderr just before its
+    result is yielded, so output reads as if the tasks ran one by one; an
+    exception raised by func is re-raised here after its output.
+
+    Args:
+        func: Module-level function taking one task
+        tasks: Picklable task arguments
+        max_workers: Worker processes (defaults to the CPU count)
+        initializer: Module-level function setting up each worker
+        initargs: Arguments for initializer
+
+    Yields:
+        func's result for each task, in task order
+    """
+    workers = max_workers or os.cpu_count() or 1
+    # A few chunks per worker keeps them busy without a round trip per task
+    chunksize = max(1, len(tasks) // (4 * workers))
+    debug = logging.getLogger('sceptre_sync').isEnabledFor(logging.DEBUG)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_pool_worker,
+                             initargs=(debug, initializer, initargs)) as executor:
+        for result, out, err, error in executor.map(
+                functools.partial(_call_capturing_output, func), tasks,
+                chunksize=chunksize):
+            sys.stdout.write(out)
+            sys.stderr.write(err)
+            if error is not None:
+                raise error
+            yield result
@@ -34,6 +34,12 @@ CONFIG_SCHEMA = {
     }
 }
 
+# Checking the schema itself and building a validator for it is the costly
+# part of jsonschema.validate, so do it once at import time
+_VALIDATOR_CLASS = jsonschema.validators.validator_for(CONFIG_SCHEMA)
+_VALIDATOR_CLASS.check_schema(CONFIG_SCHEMA)
+_VALIDATOR = _VALIDATOR_CLASS(CONFIG_SCHEMA)
+
 
 def validate_config(config: Dict[str, Any]) -> bool:
     """
@@ -45,5 +51,7 @@ def validate_config(config: Dict[str, Any]) -> bool:
     Returns:
         True if valid, raises jsonschema.ValidationError otherwise
     """
-    jsonschema.validate(instance=config, schema=CONFIG_SCHEMA)
+    error = jsonschema.exceptions.best_match(_VALIDATOR.iter_errors(config))
+    if error is not None:
+        raise error
     return True
@@ -9,20 +9,94 @@ This utility allows selective copying of parameters from a source file to a targ
 based on configuration rules, preserving formatting and comments.
 """
 
-import argparse
-import fnmatch
+from __future__ import annotations
+
+import functools
+import importlib.util
+import logging
+import os
+import re
 import sys
-from typing import Dict, List, Optional, Tuple
+from io import StringIO
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+# ruamel.yaml is imported when a ParamSync is created, so that e.g. --help
+# does not pay for loading it
+if TYPE_CHECKING:
+    from ruamel.yaml.comments import CommentedMap
+
+# Whether ruamel.yaml.clib is installed, for the rules file's safe loader.
+# Looked up without importing it, since importing it loads ruamel.yaml.
+HAS_LIBYAML = importlib.util.find_spec('_ruamel_yaml') is not None
+
+from .common import compile_glob, format_diff_summary, run_in_pool, values_differ
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for dict lookups where None is a valid value
+_MISSING = object()
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel that a file will be read front to back (more readahead)."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_filter(filter_spec: str) -> Tuple[Tuple[str, Tuple[str, ...], str, bool], ...]:
+    """
+    Split a filter specification into its individual filters.
+
+    Args:
+        filter_spec: The filter specification string (see ParamSync.matches_filter)
+
+    Returns:
+        (field_path, field_parts, value_spec, is_exclusion) per filter
+    """
+    filters = []
+
+    # Split multiple filters by comma (AND logic)
+    for single_filter in filter_spec.split(','):
+        single_filter = single_filter.strip()
+        if ':' not in single_filter:
+            continue  # Skip invalid filters
+
+        field_path, value_spec = single_filter.split(':', 1)
+
+        # Check if this is an exclusion filter
+        is_exclusion = value_spec.startswith('!')
+        if is_exclusion:
+            value_spec = value_spec[1:]  # Remove the ! prefix
+
+        filters.append((field_path, tuple(field_path.split('.')), value_spec, is_exclusion))
 
-import ruamel.yaml
-from ruamel.yaml.comments import CommentedMap
+    return tuple(filters)
 
-from .common import format_diff_summary
+
+@functools.lru_cache(maxsize=256)
+def _split_key_path(key_path: str) -> Tuple[str, ...]:
+    """
+    Split a dot notation key path, reusing the result for repeat paths.
+
+    Args:
+        key_path: Path such as "stack_tags.nested"
+
+    Returns:
+        The path components
+    """
+    return tuple(key_path.split('.'))
 
 
 class ParamSync:
     """Main class for parameter synchronization operations."""
 
+    # Minimum number of targets before a batch sync uses a process pool
+    parallel_threshold = 32
+
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize the ParamSync utility.
@@ -30,11 +104,25 @@ class ParamSync:
         Args:
             config_file: Path to the configuration file defining sync rules
         """
+        import ruamel.yaml
+
         self.yaml = ruamel.yaml.YAML()
         self.yaml.preserve_quotes = True
         self.yaml.indent(mapping=2, sequence=4, offset=2)
 
+        # The rules file is only ever read, so it doesn't need the round-trip
+        # loader; the safe loader runs on LibYAML when it is available.
+        self.config_yaml = ruamel.yaml.YAML(typ='safe')
+
         self.config = {}
+        # Compiled template patterns and file path -> matching template_patterns
+        # entries, both for _match_cache_config
+        self._compiled_patterns: List[Tuple[Pattern, Dict]] = []
+        # All compiled patterns as one alternation, to rule out paths that
+        # match none of them in a single regex call
+        self._any_pattern: Optional[Pattern] = None
+        self._match_cache: Dict[str, List[Dict]] = {}
+        self._match_cache_config = None
         if config_file:
             self.load_config(config_file)
 
@@ -50,12 +138,63 @@ class ParamSync:
         """
         try:
             with open(config_file, 'r') as f:
-                self.config = self.yaml.load(f)
+                self.config = self.config_yaml.load(f)
+            self._compile_patterns()
             return self.config
         except Exception as e:
             print(f"Error loading config file: {e}", file=sys.stderr)
             sys.exit(1)
 
+    def _matching_patterns(self, file_path: str) -> List[Dict]:
+        """
+        Get the template_patterns entries whose pattern matches a file path.
+
+        Bulk runs ask several questions about each source file, so the
+        matches are computed once per path and reused until the config changes.
+        The patterns themselves are compiled once per config.
+
+        Args:
+            file_path: Path to the file to match against patterns
+
+        Returns:
+            Matching pattern configs, in config order
+        """
+        if self._match_cache_config is not self.config:
+            self._compile_patterns()
+
+        matches = self._match_cache.get(file_path)
+        if matches is None:
+            name = os.path.normcase(file_path)
+            if self._any_pattern is None or not self._any_pattern.match(name):
+                matches = []
+            else:
+                matches = [pattern_config for regex, pattern_config in self._compiled_patterns
+                           if regex.match(name)]
+            self._match_cache[file_path] = matches
+        return matches
+
+    def _compile_patterns(self) -> None:
+        """Compile the current config's template patterns and reset the match cache."""
+        self._compiled_patterns = []
+        if self.config and 'template_patterns' in self.config:
+            for pattern_config in self.config['template_patterns']:
+                pattern = pattern_config.get('pattern')
+                if pattern:
+                    self._compiled_patterns.append((compile_glob(pattern), pattern_config))
+
+        self._any_pattern = None
+        if self._compiled_patterns:
+            # A pattern repeated across entries compiles to the same regex;
+            # joining it twice would redefine its named groups (fnmatch on
+            # Python 3.9/3.10 emits them)
+            self._any_pattern = re.compile('|'.join(
+                f'(?:{source})' for source in dict.fromkeys(
+                    regex.pattern for regex, _ in self._compiled_patterns
+                )
+            ))
+        self._match_cache = {}
+        self._match_cache_config = self.config
+
     def get_sync_params(self, file_path: str) -> List[str]:
         """
         Get the list of parameters to sync based on file path patterns.
@@ -66,14 +205,9 @@ class ParamSync:
         Returns:
             List of parameter names to synchronize
         """
-        if not self.config or 'template_patterns' not in self.config:
-            return []
-
         sync_params = []
-        for pattern_config in self.config['template_patterns']:
-            pattern = pattern_config.get('pattern')
-            if pattern and fnmatch.fnmatch(file_path, pattern):
-                sync_params.extend(pattern_config.get('sync_params', []))
+        for pattern_config in self._matching_patterns(file_path):
+            sync_params.extend(pattern_config.get('sync_params', []))
 
         return sync_params
 
@@ -87,15 +221,10 @@ class ParamSync:
         Returns:
             List of parameter names to delete
         """
-        if not self.config or 'template_patterns' not in self.config:
-            return []
-
         delete_params = []
-        for pattern_config in self.config['template_patterns']:
-            pattern = pattern_config.get('pattern')
-            if pattern and fnmatch.fnmatch(file_path, pattern):
-                if 'delete_params' in pattern_config:
-                    delete_params.extend(pattern_config.get('delete_params', []))
+        for pattern_config in self._matching_patterns(file_path):
+            if 'delete_params' in pattern_config:
+                delete_params.extend(pattern_config.get('delete_params', []))
 
         return delete_params
 
@@ -109,13 +238,9 @@ class ParamSync:
         Returns:
             True if the template should be synchronized, False otherwise
         """
-        if not self.config or 'template_patterns' not in self.config:
-            return False
-
-        for pattern_config in self.config['template_patterns']:
-            pattern = pattern_config.get('pattern')
-            if pattern and fnmatch.fnmatch(file_path, pattern):
-                return pattern_config.get('sync_template', False)
+        matches = self._matching_patterns(file_path)
+        if matches:
+            return matches[0].get('sync_template', False)
 
         return False
 
@@ -129,13 +254,9 @@ class ParamSync:
         Returns:
             The sync key to use (defaults to 'parameters')
         """
-        if not self.config or 'template_patterns' not in self.config:
-            return 'parameters'
-
-        for pattern_config in self.config['template_patterns']:
-            pattern = pattern_config.get('pattern')
-            if pattern and fnmatch.fnmatch(file_path, pattern):
-                return pattern_config.get('sync_key', 'parameters')
+        matches = self._matching_patterns(file_path)
+        if matches:
+            return matches[0].get('sync_key', 'parameters')
 
         return 'parameters'
 
@@ -151,24 +272,19 @@ class ParamSync:
         Returns:
             List of sync rule dictionaries with 'key' and 'sync_params'
         """
-        if not self.config or 'template_patterns' not in self.config:
-            return []
-        
-        for pattern_config in self.config['template_patterns']:
-            pattern = pattern_config.get('pattern')
-            if pattern and fnmatch.fnmatch(file_path, pattern):
-                # Check for new sync_rules format
-                if 'sync_rules' in pattern_config:
-                    return pattern_config['sync_rules']
-                
-                # Convert legacy format to sync_rules
-                if 'sync_params' in pattern_config:
-                    sync_key = pattern_config.get('sync_key', 'parameters')
-                    return [{
-                        'key': sync_key,
-                        'sync_params': pattern_config['sync_params'],
-                        'delete_params': pattern_config.get('delete_params', [])
-                    }]
+        for pattern_config in self._matching_patterns(file_path):
+            # Check for new sync_rules format
+            if 'sync_rules' in pattern_config:
+                return pattern_config['sync_rules']
+            
+            # Convert legacy format to sync_rules
+            if 'sync_params' in pattern_config:
+                sync_key = pattern_config.get('sync_key', 'parameters')
+                return [{
+                    'key': sync_key,
+                    'sync_params': pattern_config['sync_params'],
+                    'delete_params': pattern_config.get('delete_params', [])
+                }]
         
         return []
 
@@ -193,61 +309,66 @@ class ParamSync:
         Returns:
             True if the data matches the filter, False otherwise
         """
-        if not filter_spec:
-            return True  # No filter means match everything
-            
-        # Split multiple filters by comma (AND logic)
-        filters = filter_spec.split(',')
-        
-        for single_filter in filters:
-            single_filter = single_filter.strip()
-            if ':' not in single_filter:
-                continue  # Skip invalid filters
+        return self.compile_filter(filter_spec)(data)
+
+    def compile_filter(self, filter_spec: Optional[str]) -> Callable[..., bool]:
+        """
+        Parse a filter specification once into a reusable predicate.
+
+        See matches_filter for the filter spec format. Bulk runs compile the
+        filter up front instead of re-parsing it for every file pair.
+
+        Args:
+            filter_spec: The filter specification string
+
+        Returns:
+            A function taking the YAML data (and optionally the file it came
+            from, for the debug log) and returning True if it matches
+        """
+        filters = _parse_filter(filter_spec or '')
+
+        def predicate(data: Any, source_file: str = '') -> bool:
+            # Debug lines name the file so they can be tied back to a pair
+            where = f"{source_file}: " if source_file else ''
+            for field_path, field_parts, value_spec, is_exclusion in filters:
+                # Navigate through the nested structure
+                current = data
+                field_exists = True
                 
-            field_path, value_spec = single_filter.split(':', 1)
-            
-            # Check if this is an exclusion filter
-            is_exclusion = value_spec.startswith('!')
-            if is_exclusion:
-                value_spec = value_spec[1:]  # Remove the ! prefix
-            
-            # Navigate through the nested structure
-            field_parts = field_path.split('.')
-            current = data
-            field_exists = True
-            
-            for part in field_parts:
-                if not isinstance(current, dict) or part not in current:
-                    field_exists = False
-                    break
-                current = current[part]
-            
-            # Apply filter logic
-            if is_exclusion:
-                # Exclusion filter
-                if field_exists and isinstance(current, str):
-                    # Field exists - check it doesn't contain the value
-                    # Special case: empty exclusion value means exclude empty strings only
-                    if not value_spec:
-                        # Exclude only if the field is empty
-                        if current == '':
-                            print(f"Exclusion filter failed: field is empty")
+                for part in field_parts:
+                    if not isinstance(current, dict) or part not in current:
+                        field_exists = False
+                        break
+                    current = current[part]
+                
+                # Apply filter logic
+                if is_exclusion:
+                    # Exclusion filter
+                    if field_exists and isinstance(current, str):
+                        # Field exists - check it doesn't contain the value
+                        # Special case: empty exclusion value means exclude empty strings only
+                        if not value_spec:
+                            # Exclude only if the field is empty
+                            if current == '':
+                                logger.debug("%sExclusion filter failed: field is empty", where)
+                                return False
+                        elif value_spec in current:
+                            logger.debug("%sExclusion filter failed: '%s' found in '%s'", where, value_spec, current)
                             return False
-                    elif value_spec in current:
-                        print(f"Exclusion filter failed: '{value_spec}' found in '{current}'")
+                    # Field doesn't exist or doesn't contain value - passes exclusion
+                else:
+                    # Inclusion filter
+                    if not field_exists:
+                        logger.debug("%sField path '%s' not found in data", where, field_path)
                         return False
-                # Field doesn't exist or doesn't contain value - passes exclusion
-            else:
-                # Inclusion filter
-                if not field_exists:
-                    print(f"Field path '{field_path}' not found in data")
-                    return False
-                if not isinstance(current, str) or value_spec not in current:
-                    print(f"Filter no match: '{value_spec}' not found in '{current}'")
-                    return False
-                print(f"Filter match: '{value_spec}' found in '{current}'")
-        
-        return True  # All filters passed
+                    if not isinstance(current, str) or value_spec not in current:
+                        logger.debug("%sFilter no match: '%s' not found in '%s'", where, value_spec, current)
+                        return False
+                    logger.debug("%sFilter match: '%s' found in '%s'", where, value_spec, current)
+            
+            return True  # All filters passed
+
+        return predicate
 
     def load_yaml_file(self, file_path: str) -> CommentedMap:
         """
@@ -260,23 +381,33 @@ class ParamSync:
             CommentedMap containing the parsed YAML
         """
         try:
+            # Read the whole file at once rather than letting the parser pull
+            # it in through many small reads
             with open(file_path, 'r') as f:
-                return self.yaml.load(f)
+                _advise_sequential(f.fileno())
+                text = f.read()
+            return self.yaml.load(text)
         except Exception as e:
             print(f"Error loading YAML file {file_path}: {e}", file=sys.stderr)
             sys.exit(1)
 
-    def save_yaml_file(self, file_path: str, data: CommentedMap) -> None:
+    def save_yaml_file(self, file_path: str, data: CommentedMap, header: str = '') -> None:
         """
         Save a YAML file while preserving comments and formatting.
 
         Args:
             file_path: Path to save the YAML file
             data: CommentedMap containing the YAML data to save
+            header: Raw text (e.g. comments) to write before the document
         """
         try:
+            # Render in memory and write in one go; this also leaves the
+            # file untouched if dumping fails
+            buffer = StringIO()
+            buffer.write(header)
+            self.yaml.dump(data, buffer)
             with open(file_path, 'w') as f:
-                self.yaml.dump(data, f)
+                f.write(buffer.getvalue())
         except Exception as e:
             print(f"Error saving YAML file {file_path}: {e}", file=sys.stderr)
             sys.exit(1)
@@ -295,22 +426,8 @@ class ParamSync:
         Returns:
             Dict with 'old' and 'new' keys if templates differ, None if identical
         """
-        # Compare template path
-        if 'path' in source_template and 'path' in target_template:
-            if source_template['path'] != target_template['path']:
-                return {
-                    'old': target_template,
-                    'new': source_template
-                }
-        # Compare template type
-        elif 'type' in source_template and 'type' in target_template:
-            if source_template['type'] != target_template['type']:
-                return {
-                    'old': target_template,
-                    'new': source_template
-                }
-        # Compare entire template if structure differs
-        elif str(source_template) != str(target_template):
+        # Any difference counts, not just the path or type; key order does not
+        if source_template != target_template:
             return {
                 'old': target_template,
                 'new': source_template
@@ -318,6 +435,24 @@ class ParamSync:
 
         return None
 
+    def _diff_template_sections(self, source_data: Dict, target_data: Dict) -> Optional[Dict]:
+        """
+        Compare the template sections of two documents, if both have one.
+
+        Args:
+            source_data: Source YAML data
+            target_data: Target YAML data
+
+        Returns:
+            Dict with 'old' and 'new' keys if the templates differ, None if
+            they are identical or either document has no template
+        """
+        source_template = source_data.get('template', _MISSING)
+        target_template = target_data.get('template', _MISSING)
+        if source_template is _MISSING or target_template is _MISSING:
+            return None
+        return self._compare_templates(source_template, target_template)
+
     def _get_nested_value(self, data: Dict, key_path: str) -> Optional[Dict]:
         """
         Get a nested value from data using dot notation.
@@ -329,18 +464,14 @@ class ParamSync:
         Returns:
             The value at the specified path, or None if not found
         """
-        parts = key_path.split('.')
         current = data
-        
-        for part in parts[:-1]:
-            if not isinstance(current, dict) or part not in current:
-                return None
-            current = current[part]
-        
-        # Return the final part if it exists
-        if isinstance(current, dict) and parts[-1] in current:
-            return current[parts[-1]]
-        return None
+        try:
+            for part in _split_key_path(key_path):
+                current = current[part]
+        except (KeyError, TypeError):
+            # Missing key, or a non-mapping (scalar, list, None) on the way
+            return None
+        return current
 
     def _set_nested_value(self, data: Dict, key_path: str, value: Dict) -> None:
         """
@@ -351,7 +482,7 @@ class ParamSync:
             key_path: Path to set (e.g., "stack_tags.nested")
             value: The value to set
         """
-        parts = key_path.split('.')
+        parts = _split_key_path(key_path)
         current = data
         
         # Create nested structure if needed
@@ -363,6 +494,64 @@ class ParamSync:
         # Set the final value
         current[parts[-1]] = value
 
+    def _ensure_mapping(self, data: Dict, key_path: str) -> Dict:
+        """
+        Get the mapping at a (dot notation) key path, creating missing levels.
+
+        Args:
+            data: The data dictionary
+            key_path: Path to the mapping (e.g., "stack_tags.nested")
+
+        Returns:
+            The mapping at the specified path
+        """
+        current = data
+        for part in _split_key_path(key_path):
+            if part not in current:
+                current[part] = {}
+            current = current[part]
+        return current
+
+    def _delete_params(self, data: Dict, key_path: str, params: Iterable[str]) -> None:
+        """
+        Delete parameters from the mapping at a (dot notation) key path.
+
+        Args:
+            data: The data dictionary
+            key_path: Path to the mapping (e.g., "stack_tags.nested")
+            params: Names of the parameters to delete
+        """
+        target_values = self._get_nested_value(data, key_path)
+        if not target_values:
+            return
+        for param in params:
+            target_values.pop(param, None)
+
+    def _apply_key_diff(self, target_data: Dict, key_path: str, key_diff: Dict) -> None:
+        """
+        Apply the parameter changes of one key's diff to the target data.
+
+        New values are taken from the diff itself, which already holds the
+        source values with any static values laid over them.
+
+        Args:
+            target_data: Target YAML data to modify
+            key_path: Key the diff belongs to (dot notation for nested keys)
+            key_diff: Diff with 'added', 'modified' and 'deleted' parameters
+        """
+        added = key_diff['added']
+        modified = key_diff['modified']
+        if added or modified:
+            # Create the key's structure if it doesn't exist
+            target_values = self._ensure_mapping(target_data, key_path)
+            for param, param_value in added.items():
+                target_values[param] = param_value
+            for param, change in modified.items():
+                target_values[param] = change['new']
+
+        if key_diff['deleted']:
+            self._delete_params(target_data, key_path, key_diff['deleted'])
+
     def _diff_parameters(self, source_params: Dict, target_params: Dict,
                          params_to_sync: List[str]) -> Tuple[Dict, Dict, Dict]:
         """
@@ -383,19 +572,23 @@ class ParamSync:
         modified = {}
         unchanged = {}
 
-        for param in params_to_sync:
-            if param in source_params:
-                source_value = source_params[param]
+        # Overlapping patterns can request a parameter more than once;
+        # compare each one once, in the order it was first requested
+        for param in dict.fromkeys(params_to_sync):
+            source_value = source_params.get(param, _MISSING)
+            if source_value is _MISSING:
+                continue
 
-                if param not in target_params:
-                    added[param] = source_value
-                elif str(source_params[param]) != str(target_params[param]):
-                    modified[param] = {
-                        'old': target_params[param],
-                        'new': source_value
-                    }
-                else:
-                    unchanged[param] = source_value
+            target_value = target_params.get(param, _MISSING)
+            if target_value is _MISSING:
+                added[param] = source_value
+            elif values_differ(source_value, target_value):
+                modified[param] = {
+                    'old': target_value,
+                    'new': source_value
+                }
+            else:
+                unchanged[param] = source_value
 
         return added, modified, unchanged
 
@@ -416,6 +609,16 @@ class ParamSync:
         Returns:
             Dict containing added, modified, unchanged, and deleted parameters
         """
+        # Nothing requested, nothing to look up
+        if not params_to_sync and not params_to_delete and not sync_template:
+            return {
+                'added': {},
+                'modified': {},
+                'unchanged': {},
+                'deleted': {},
+                'template': None
+            }
+
         # Handle None/empty YAML files
         if source_data is None:
             source_data = {}
@@ -437,17 +640,13 @@ class ParamSync:
 
         # Check parameters to delete
         deleted = {}
-        for param in params_to_delete:
-            if param in target_params:
-                deleted[param] = target_params[param]
+        for param in dict.fromkeys(params_to_delete):
+            target_value = target_params.get(param, _MISSING)
+            if target_value is not _MISSING:
+                deleted[param] = target_value
 
         # Check template if requested
-        template_diff = None
-        if sync_template and 'template' in source_data and 'template' in target_data:
-            template_diff = self._compare_templates(
-                source_data['template'],
-                target_data['template']
-            )
+        template_diff = self._diff_template_sections(source_data, target_data) if sync_template else None
 
         return {
             'added': added,
@@ -485,6 +684,16 @@ class ParamSync:
             sync_params = rule.get('sync_params', [])
             delete_params = rule.get('delete_params', [])
             static_values = rule.get('static_values', {})
+
+            # Nothing to compare for this key; skip looking it up
+            if not sync_params and not delete_params and not static_values:
+                multi_diff[key] = {
+                    'added': {},
+                    'modified': {},
+                    'unchanged': {},
+                    'deleted': {}
+                }
+                continue
             
             # Get source and target data for this key
             if '.' in key:
@@ -497,8 +706,9 @@ class ParamSync:
             # Start with source values for sync_params
             effective_source = {}
             for param in sync_params:
-                if param in source_key_data:
-                    effective_source[param] = source_key_data[param]
+                source_value = source_key_data.get(param, _MISSING)
+                if source_value is not _MISSING:
+                    effective_source[param] = source_value
             
             # Override/add static values
             # Static values take precedence over source values
@@ -511,25 +721,25 @@ class ParamSync:
             unchanged = {}
             deleted = {}
             
-            # Check all params that should be synced (from source + static)
-            all_params = set(sync_params) | set(static_values.keys())
-            for param in all_params:
-                if param in effective_source:
-                    source_value = effective_source[param]
-                    if param not in target_key_data:
-                        added[param] = source_value
-                    elif str(source_value) != str(target_key_data[param]):
-                        modified[param] = {
-                            'old': target_key_data[param],
-                            'new': source_value
-                        }
-                    else:
-                        unchanged[param] = source_value
+            # Check all params that should be synced (from source + static);
+            # effective_source already holds exactly those present, in order
+            for param, source_value in effective_source.items():
+                target_value = target_key_data.get(param, _MISSING)
+                if target_value is _MISSING:
+                    added[param] = source_value
+                elif values_differ(source_value, target_value):
+                    modified[param] = {
+                        'old': target_value,
+                        'new': source_value
+                    }
+                else:
+                    unchanged[param] = source_value
             
             # Check parameters to delete
             for param in delete_params:
-                if param in target_key_data:
-                    deleted[param] = target_key_data[param]
+                target_value = target_key_data.get(param, _MISSING)
+                if target_value is not _MISSING:
+                    deleted[param] = target_value
             
             # Store the diff under the key name
             multi_diff[key] = {
@@ -540,13 +750,9 @@ class ParamSync:
             }
         
         # Handle template if requested
-        if sync_template:
-            multi_diff['template'] = self._compare_templates(
-                source_data.get('template', {}),
-                target_data.get('template', {})
-            ) if 'template' in source_data and 'template' in target_data else None
-        else:
-            multi_diff['template'] = None
+        multi_diff['template'] = (
+            self._diff_template_sections(source_data, target_data) if sync_template else None
+        )
             
         return multi_diff
 
@@ -556,7 +762,8 @@ class ParamSync:
                         dry_run: bool = False,
                         sync_template: Optional[bool] = None,
                         filter_spec: Optional[str] = None,
-                        sync_key: str = 'parameters') -> Dict:
+                        sync_key: str = 'parameters',
+                        filter_pred: Optional[Callable[..., bool]] = None) -> Dict:
         """
         Synchronize parameters from source file to target file.
 
@@ -569,33 +776,89 @@ class ParamSync:
             sync_template: Whether to sync the template section (if None, determined from config)
             filter_spec: Filter specification to apply (field_path:substring)
             sync_key: The key to synchronize (defaults to 'parameters')
+            filter_pred: filter_spec already compiled with compile_filter
 
         Returns:
             Dict containing the diff of changes
         """
-        # Load source and target files
-        source_data = self.load_yaml_file(source_file)
-        target_data = self.load_yaml_file(target_file)
-        
-        # Check if target file has only comments (loaded as None)
-        # If so, we need to preserve the original content when writing
-        target_was_comments_only = target_data is None
-        if target_was_comments_only:
-            # Read the original file content to preserve comments
-            with open(target_file, 'r') as f:
-                original_target_content = f.read()
+        diff, documents = self.diff_files(
+            source_file, target_file, params_to_sync, params_to_delete,
+            sync_template, filter_spec, sync_key, filter_pred
+        )
+
+        # Apply changes if not dry run
+        if not dry_run and documents is not None:
+            self.apply_diff(source_file, target_file, diff, sync_key, documents)
+
+        return diff
+
+    def diff_files(self, source_file: str, target_file: str,
+                   params_to_sync: Optional[List[str]] = None,
+                   params_to_delete: Optional[List[str]] = None,
+                   sync_template: Optional[bool] = None,
+                   filter_spec: Optional[str] = None,
+                   sync_key: str = 'parameters',
+                   filter_pred: Optional[Callable[..., bool]] = None,
+                   source_document: Optional[CommentedMap] = None
+                   ) -> Tuple[Dict, Optional[Tuple[CommentedMap, CommentedMap]]]:
+        """
+        Compute the diff between two files, keeping the parsed documents.
+
+        Takes the same arguments as sync_parameters. The returned documents
+        can be handed to apply_diff so applying the diff needs no second
+        read of either file.
+
+        Args:
+            source_file: Path to the source YAML file
+            target_file: Path to the target YAML file
+            params_to_sync: List of parameters to synchronize (if None, determined from config)
+            params_to_delete: List of parameters to delete (if None, determined from config)
+            sync_template: Whether to sync the template section (if None, determined from config)
+            filter_spec: Filter specification to apply (field_path:substring)
+            sync_key: The key to synchronize (defaults to 'parameters')
+            filter_pred: filter_spec already compiled with compile_filter
+            source_document: Already parsed source file (loaded from
+                source_file if None); it is only read, never modified
 
+        Returns:
+            Tuple of (diff, (source data, target data)). The documents are
+            None when there is nothing to apply (filtered out or no sync
+            parameters).
+        """
+        # Resolve what to sync before parsing anything, so that files with
+        # nothing to sync are not loaded at all
+        sync_rules = self.get_sync_rules(source_file)
+        no_sync_params = False
+        if not sync_rules and params_to_sync is None:
+            params_to_sync = self.get_sync_params(source_file)
+            no_sync_params = not params_to_sync
+
+        if no_sync_params and not filter_spec:
+            return self._no_sync_params(source_file)
+
+        # Load source file
+        if source_document is None:
+            source_data = self.load_yaml_file(source_file)
+        else:
+            source_data = source_document
+        
         # Apply filter if specified
         if filter_spec:
-            if not self.matches_filter(source_data, filter_spec):
+            if filter_pred is None:
+                filter_pred = self.compile_filter(filter_spec)
+            if not filter_pred(source_data, source_file):
                 print(f"Source file {source_file} does not match filter {filter_spec}, skipping.")
-                return {}
+                return {}, None
             else:
                 print(f"Source file {source_file} matches filter {filter_spec}, processing.")
 
+        if no_sync_params:
+            return self._no_sync_params(source_file)
+
+        # Only parse the target once the pair is known to need a diff
+        target_data = self.load_yaml_file(target_file)
+
         # Check if we have sync rules (multi-key) or need to use single-key logic
-        sync_rules = self.get_sync_rules(source_file)
-        
         if sync_rules:
             # Multi-key sync using sync_rules
             # Determine if template should be synced
@@ -608,16 +871,6 @@ class ParamSync:
             )
         else:
             # Legacy single-key sync
-            # Determine parameters to sync if not provided
-            if params_to_sync is None:
-                params_to_sync = self.get_sync_params(source_file)
-                if not params_to_sync:
-                    print(f"No sync parameters defined for {source_file}", file=sys.stderr)
-                    return {
-                        'added': {}, 'modified': {}, 'unchanged': {},
-                        'deleted': {}, 'template': None
-                    }
-
             # Determine parameters to delete if not provided
             if params_to_delete is None:
                 params_to_delete = self.get_delete_params(source_file)
@@ -632,152 +885,203 @@ class ParamSync:
                 params_to_delete, sync_template, sync_key
             )
 
-        # Apply changes if not dry run
-        if not dry_run:
-            # Initialize target_data if it was None/empty
-            if target_data is None:
-                target_data = {}
-                
-            if sync_rules:
-                # Multi-key apply
-                for key_name, key_diff in diff.items():
-                    if key_name == 'template':
-                        # Handle template separately
-                        if key_diff:
-                            target_data['template'] = source_data['template']
-                        continue
-                    
-                    # Get source values for this key
-                    if '.' in key_name:
-                        source_values = self._get_nested_value(source_data, key_name) or {}
-                    else:
-                        source_values = source_data.get(key_name, {})
-                    
-                    # Apply additions and modifications
-                    added_and_modified = list(key_diff['added'].keys()) + list(key_diff['modified'].keys())
-                    
-                    # Need to rebuild effective source for apply
-                    # Find the sync rule for this key to get static values
-                    rule = next((r for r in sync_rules if r['key'] == key_name), None)
-                    if rule:
-                        static_values = rule.get('static_values', {})
-                        # Build effective source with static values
-                        effective_source = {}
-                        for param in added_and_modified:
-                            if param in static_values:
-                                effective_source[param] = static_values[param]
-                            elif param in source_values:
-                                effective_source[param] = source_values[param]
-                        
-                        # Apply from effective source
-                        for param in added_and_modified:
-                            if param in effective_source:
-                                param_value = effective_source[param]
-                                if '.' in key_name:
-                                    # Get or create the nested structure
-                                    parts = key_name.split('.')
-                                    current = target_data
-                                    for part in parts[:-1]:
-                                        if part not in current:
-                                            current[part] = {}
-                                        current = current[part]
-                                    if parts[-1] not in current:
-                                        current[parts[-1]] = {}
-                                    current[parts[-1]][param] = param_value
-                                else:
-                                    if key_name not in target_data:
-                                        target_data[key_name] = {}
-                                    target_data[key_name][param] = param_value
-                    else:
-                        # Fallback to old behavior if no rule found
-                        for param in added_and_modified:
-                            if '.' in key_name:
-                                # Get or create the nested structure
-                                parts = key_name.split('.')
-                                current = target_data
-                                for part in parts[:-1]:
-                                    if part not in current:
-                                        current[part] = {}
-                                    current = current[part]
-                                if parts[-1] not in current:
-                                    current[parts[-1]] = {}
-                                current[parts[-1]][param] = source_values.get(param)
-                            else:
-                                if key_name not in target_data:
-                                    target_data[key_name] = {}
-                                target_data[key_name][param] = source_values.get(param)
-                    
-                    # Apply deletions
-                    for param in key_diff['deleted'].keys():
-                        if '.' in key_name:
-                            target_values = self._get_nested_value(target_data, key_name)
-                            if target_values and param in target_values:
-                                del target_values[param]
-                        else:
-                            if key_name in target_data and param in target_data[key_name]:
-                                del target_data[key_name][param]
-            else:
-                # Single-key apply (legacy)
-                # Get source values
-                if '.' in sync_key:
-                    source_values = self._get_nested_value(source_data, sync_key) or {}
-                else:
-                    source_values = source_data.get(sync_key, {})
-
-                # Apply parameter additions and modifications
-                added_and_modified = list(diff['added'].keys()) + list(diff['modified'].keys())
-                for param in added_and_modified:
-                    # Create the sync_key structure if it doesn't exist
-                    if '.' in sync_key:
-                        # Get or create the nested structure
-                        parts = sync_key.split('.')
-                        current = target_data
-                        for part in parts[:-1]:
-                            if part not in current:
-                                current[part] = {}
-                            current = current[part]
-                        if parts[-1] not in current:
-                            current[parts[-1]] = {}
-                        current[parts[-1]][param] = source_values[param]
-                    else:
-                        if sync_key not in target_data:
-                            target_data[sync_key] = {}
-                        target_data[sync_key][param] = source_values[param]
-
-                # Apply parameter deletions
-                for param in diff['deleted'].keys():
-                    if '.' in sync_key:
-                        target_values = self._get_nested_value(target_data, sync_key)
-                        if target_values and param in target_values:
-                            del target_values[param]
-                    else:
-                        if sync_key in target_data and param in target_data[sync_key]:
-                            del target_data[sync_key][param]
-
-                # Apply template change if needed
-                if diff['template']:
-                    target_data['template'] = source_data['template']
-
-            # Save the updated target file
-            if target_was_comments_only and target_data:
-                # Special handling for files that were comments-only
-                # We need to append the new data while preserving comments
-                with open(target_file, 'w') as f:
-                    # Write original comments
-                    f.write(original_target_content.rstrip())
-                    if original_target_content and not original_target_content.endswith('\n'):
-                        f.write('\n')
-                    # Append the new data
-                    from io import StringIO
-                    stream = StringIO()
-                    self.yaml.dump(target_data, stream)
-                    f.write(stream.getvalue())
-            else:
-                # Normal save for files that had data structure
-                self.save_yaml_file(target_file, target_data)
+        return diff, (source_data, target_data)
+
+    def _no_sync_params(self, source_file: str) -> Tuple[Dict, None]:
+        """Report a source file without sync parameters and return its empty diff."""
+        print(f"No sync parameters defined for {source_file}", file=sys.stderr)
+        return {
+            'added': {}, 'modified': {}, 'unchanged': {},
+            'deleted': {}, 'template': None
+        }, None
+
+    def sync_parameters_batch(self, source_file: str, target_files: List[str],
+                              params_to_sync: Optional[List[str]] = None,
+                              params_to_delete: Optional[List[str]] = None,
+                              dry_run: bool = False,
+                              sync_template: Optional[bool] = None,
+                              filter_spec: Optional[str] = None,
+                              sync_key: str = 'parameters',
+                              max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Synchronize parameters from one source file to several target files.
+
+        Equivalent to calling sync_parameters for each target, but the
+        source file is parsed, the filter compiled and the parameters to
+        sync narrowed to those present in the source only once. Targets are
+        independent, so large batches are spread across a process pool (the
+        YAML parser is pure Python and holds the GIL); each worker receives
+        the parsed source once.
+
+        Args:
+            source_file: Path to the source YAML file
+            target_files: Paths to the target YAML files
+            params_to_sync: List of parameters to synchronize (if None, determined from config)
+            params_to_delete: List of parameters to delete (if None, determined from config)
+            dry_run: If True, only show changes without applying them
+            sync_template: Whether to sync the template section (if None, determined from config)
+            filter_spec: Filter specification to apply (field_path:substring)
+            sync_key: The key to synchronize (defaults to 'parameters')
+            max_workers: Worker processes for large batches (defaults to the
+                CPU count; 1 disables the process pool)
+
+        Returns:
+            Dict mapping each target file to its diff
+        """
+        # A target listed twice must not be written by two workers at once
+        target_files = list(dict.fromkeys(target_files))
+        source_data = self.load_yaml_file(source_file)
+        params_to_sync = self._params_in_source(source_file, source_data,
+                                                params_to_sync, sync_key)
+        options = (params_to_sync, params_to_delete, dry_run, sync_template,
+                   filter_spec, sync_key)
+
+        if len(target_files) < self.parallel_threshold or max_workers == 1:
+            filter_pred = self.compile_filter(filter_spec) if filter_spec else None
+            return {
+                target_file: self._sync_target(source_file, source_data, target_file,
+                                               *options, filter_pred)
+                for target_file in target_files
+            }
+
+        tasks = [(source_file, target_file, options) for target_file in target_files]
+        return dict(zip(target_files, run_in_pool(
+            _sync_target_in_worker, tasks, max_workers=max_workers,
+            initializer=_init_batch_worker, initargs=(self.config, source_data, filter_spec)
+        )))
+
+    def _params_in_source(self, source_file: str, source_data: Optional[CommentedMap],
+                          params_to_sync: Optional[List[str]],
+                          sync_key: str) -> Optional[List[str]]:
+        """
+        Narrow the single-key parameters to sync to those the source has.
+
+        Parameters missing from the source never show up in a diff, so
+        every target of a batch can skip them.
 
+        Args:
+            source_file: Path to the source YAML file
+            source_data: Parsed source file
+            params_to_sync: List of parameters to synchronize (if None, determined from config)
+            sync_key: The key to synchronize
+
+        Returns:
+            The parameters present in the source, in requested order, or
+            params_to_sync unchanged when diff_files has to resolve it itself
+            (multi-key sync, or no parameters configured)
+        """
+        if self.get_sync_rules(source_file):
+            return params_to_sync
+        if params_to_sync is None:
+            params_to_sync = self.get_sync_params(source_file)
+            if not params_to_sync:
+                return None
+
+        source_params = self._get_nested_value(source_data or {}, sync_key) or {}
+        return [param for param in dict.fromkeys(params_to_sync) if param in source_params]
+
+    def _sync_target(self, source_file: str, source_data: Optional[CommentedMap],
+                     target_file: str, params_to_sync: Optional[List[str]],
+                     params_to_delete: Optional[List[str]], dry_run: bool,
+                     sync_template: Optional[bool], filter_spec: Optional[str],
+                     sync_key: str, filter_pred: Optional[Callable[..., bool]]) -> Dict:
+        """Sync one target of a batch against the already parsed source."""
+        diff, documents = self.diff_files(
+            source_file, target_file, params_to_sync, params_to_delete,
+            sync_template, filter_spec, sync_key, filter_pred,
+            source_document=source_data
+        )
+        if not dry_run and documents is not None:
+            self.apply_diff(source_file, target_file, diff, sync_key, documents)
         return diff
 
+    def apply_diff(self, source_file: str, target_file: str, diff: Dict,
+                   sync_key: str = 'parameters',
+                   documents: Optional[Tuple[CommentedMap, CommentedMap]] = None) -> None:
+        """
+        Apply a diff previously computed by a dry-run of sync_parameters.
+
+        The files are not filtered or diffed again, so a dry-run followed by
+        apply_diff does the diffing work only once, and the values written
+        are exactly those shown in the diff. Passing the documents
+        returned by diff_files also skips reading the files again.
+
+        Args:
+            source_file: Path to the source YAML file
+            target_file: Path to the target YAML file
+            diff: Diff returned by sync_parameters for the same files
+            sync_key: The key that was synchronized (single-key diffs only)
+            documents: (source data, target data) from diff_files, or None to
+                load both files
+        """
+        if not diff:
+            return
+
+        if documents is None:
+            documents = (self.load_yaml_file(source_file),
+                         self.load_yaml_file(target_file))
+        source_data, target_data = documents
+        sync_rules = self.get_sync_rules(source_file)
+
+        self._apply_changes(source_data, target_data, target_file,
+                            diff, sync_rules, sync_key)
+
+    def _apply_changes(self, source_data: Dict, target_data: Optional[Dict],
+                       target_file: str, diff: Dict, sync_rules: List[Dict],
+                       sync_key: str) -> None:
+        """
+        Apply a diff to the loaded target data and save the target file.
+
+        Args:
+            source_data: Source YAML data
+            target_data: Target YAML data (None if the file has only comments)
+            target_file: Path to the target YAML file
+            diff: Diff of changes to apply
+            sync_rules: Sync rules for the source file (empty for single-key sync)
+            sync_key: The key to synchronize for single-key sync
+        """
+        # Check if target file has only comments (loaded as None)
+        # If so, we need to preserve the original content when writing
+        target_was_comments_only = target_data is None
+        if target_was_comments_only:
+            # Read the original file content to preserve comments
+            with open(target_file, 'r') as f:
+                original_target_content = f.read()
+
+        # Initialize target_data if it was None/empty
+        if target_data is None:
+            target_data = {}
+            
+        if sync_rules:
+            # Multi-key apply
+            for key_name, key_diff in diff.items():
+                if key_name == 'template':
+                    # Handle template separately
+                    if key_diff:
+                        target_data['template'] = source_data['template']
+                    continue
+
+                self._apply_key_diff(target_data, key_name, key_diff)
+        else:
+            # Single-key apply (legacy)
+            self._apply_key_diff(target_data, sync_key, diff)
+
+            # Apply template change if needed
+            if diff['template']:
+                target_data['template'] = source_data['template']
+
+        # Save the updated target file
+        if target_was_comments_only and target_data:
+            # Special handling for files that were comments-only
+            # We need to append the new data while preserving comments
+            header = original_target_content.rstrip()
+            if header:
+                header += '\n'
+            self.save_yaml_file(target_file, target_data, header=header)
+        else:
+            # Normal save for files that had data structure
+            self.save_yaml_file(target_file, target_data)
+
     def print_diff(self, diff: Dict) -> None:
         """
         Print a human-readable diff of changes.
@@ -796,38 +1100,40 @@ class ParamSync:
             self.print_diff_multi(diff)
             return
 
-        changes_exist = (
-            diff['added'] or diff['modified'] or
-            diff['deleted'] or diff['template']
-        )
+        added, modified, deleted = diff['added'], diff['modified'], diff['deleted']
+        template, unchanged = diff['template'], diff['unchanged']
+
+        changes_exist = added or modified or deleted or template
         if not changes_exist:
             print("No changes to apply.")
             return
 
-        print("\nChanges to apply:")
+        lines = ["\nChanges to apply:"]
+
+        if added:
+            lines.append("\n  Parameters to add:")
+            for param, value in added.items():
+                lines.append(f"    + {param}: {value}")
 
-        if diff['added']:
-            print("\n  Parameters to add:")
-            for param, value in diff['added'].items():
-                print(f"    + {param}: {value}")
+        if modified:
+            lines.append("\n  Parameters to modify:")
+            for param, values in modified.items():
+                lines.append(f"    ~ {param}: {values['old']} -> {values['new']}")
 
-        if diff['modified']:
-            print("\n  Parameters to modify:")
-            for param, values in diff['modified'].items():
-                print(f"    ~ {param}: {values['old']} -> {values['new']}")
+        if deleted:
+            lines.append("\n  Parameters to delete:")
+            for param, value in deleted.items():
+                lines.append(f"    - {param}: {value}")
 
-        if diff['deleted']:
-            print("\n  Parameters to delete:")
-            for param, value in diff['deleted'].items():
-                print(f"    - {param}: {value}")
+        if template:
+            lines.append("\n  Template to modify:")
+            lines.append(f"    ~ {template['old']} -> {template['new']}")
 
-        if diff['template']:
-            print("\n  Template to modify:")
-            print(f"    ~ {diff['template']['old']} -> {diff['template']['new']}")
+        if unchanged:
+            lines.append(f"\n  {len(unchanged)} parameters already in sync.")
+
+        print("\n".join(lines))
 
-        if diff['unchanged']:
-            print(f"\n  {len(diff['unchanged'])} parameters already in sync.")
-    
     def print_diff_multi(self, diff: Dict) -> None:
         """
         Print a human-readable diff for multi-key changes.
@@ -835,60 +1141,80 @@ class ParamSync:
         Args:
             diff: Dict containing diffs organized by key
         """
-        # Check if any changes exist
-        has_changes = False
-        for key, key_diff in diff.items():
-            if key == 'template':
-                if key_diff:
-                    has_changes = True
-            elif isinstance(key_diff, dict) and (
-                key_diff.get('added') or key_diff.get('modified') or key_diff.get('deleted')
-            ):
-                has_changes = True
-                break
+        # Keys with something to print, found in a single pass
+        dirty_keys = [
+            key for key, key_diff in sorted(diff.items())
+            if (key_diff if key == 'template' else (
+                isinstance(key_diff, dict) and (
+                    key_diff.get('added') or key_diff.get('modified') or key_diff.get('deleted')
+                )
+            ))
+        ]
         
-        if not has_changes:
+        if not dirty_keys:
             print("No changes to apply.")
             return
             
-        print("\nChanges to apply:")
+        lines = ["\nChanges to apply:"]
         
-        # Process each key
-        for key, key_diff in sorted(diff.items()):
+        for key in dirty_keys:
+            key_diff = diff[key]
             if key == 'template':
-                if key_diff:
-                    print("\n  Template to modify:")
-                    print(f"    ~ {key_diff['old']} -> {key_diff['new']}")
+                lines.append("\n  Template to modify:")
+                lines.append(f"    ~ {key_diff['old']} -> {key_diff['new']}")
                 continue
             
-            if not isinstance(key_diff, dict):
-                continue
-                
-            changes_in_key = (
-                key_diff.get('added') or key_diff.get('modified') or key_diff.get('deleted')
-            )
+            lines.append(f"\n  [{key}]")
             
-            if changes_in_key:
-                print(f"\n  [{key}]")
-                
-                if key_diff.get('added'):
-                    for param, value in key_diff['added'].items():
-                        print(f"    + {param}: {value}")
-                
-                if key_diff.get('modified'):
-                    for param, values in key_diff['modified'].items():
-                        print(f"    ~ {param}: {values['old']} -> {values['new']}")
-                
-                if key_diff.get('deleted'):
-                    for param, value in key_diff['deleted'].items():
-                        print(f"    - {param}: {value}")
-                
-                if key_diff.get('unchanged'):
-                    print(f"    ({len(key_diff['unchanged'])} unchanged)")
+            added = key_diff.get('added')
+            if added:
+                for param, value in added.items():
+                    lines.append(f"    + {param}: {value}")
+            
+            modified = key_diff.get('modified')
+            if modified:
+                for param, values in modified.items():
+                    lines.append(f"    ~ {param}: {values['old']} -> {values['new']}")
+            
+            deleted = key_diff.get('deleted')
+            if deleted:
+                for param, value in deleted.items():
+                    lines.append(f"    - {param}: {value}")
+            
+            unchanged = key_diff.get('unchanged')
+            if unchanged:
+                lines.append(f"    ({len(unchanged)} unchanged)")
+
+        print("\n".join(lines))
+
+
+# ParamSync instance, parsed source and compiled filter owned by a batch
+# worker process, built once by _init_batch_worker
+_batch_worker: Optional[Tuple[ParamSync, Any, Optional[Callable[..., bool]]]] = None
+
+
+def _init_batch_worker(config: Dict, source_data: Any, filter_spec: Optional[str]) -> None:
+    """Set up the sync rules, source document and filter once per worker process."""
+    global _batch_worker
+    param_sync = ParamSync()
+    param_sync.config = config
+    filter_pred = param_sync.compile_filter(filter_spec) if filter_spec else None
+    _batch_worker = (param_sync, source_data, filter_pred)
+
+
+def _sync_target_in_worker(args: Tuple[str, str, Tuple]) -> Dict:
+    """Sync one batch target in a worker process."""
+    source_file, target_file, options = args
+    param_sync, source_data, filter_pred = _batch_worker
+    return param_sync._sync_target(source_file, source_data, target_file,
+                                   *options, filter_pred)
 
 
 def main():
     """Main entry point for the command line interface."""
+    # Only the command line needs argparse; library users skip loading it
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Synchronize parameters between YAML configuration files"
     )
@@ -903,7 +1229,7 @@ def main():
                         help="Sync the template section")
     parser.add_argument("--filter", "-f",
                         help="Filter by field value (format: field.path:substring)")
-    parser.add_argument("--sync-key", "-k",
+    parser.add_argument("--sync-key", "-k", default="parameters",
                         help="Key to synchronize (default: parameters)")
 
     args = parser.parse_args()
@@ -920,7 +1246,7 @@ def main():
         args.dry_run,
         args.sync_template,
         args.filter,
-        sync_key=args.sync_key if args.sync_key else 'parameters'
+        sync_key=args.sync_key
     )
 
     # Print diff
@@ -0,0 +1,107 @@
+"""
+Persistent record of file pairs known to be in sync.
+
+A bulk run over a large config tree usually finds most pairs already in
+sync. The state file remembers, for each (source, target) pair that was in
+sync when last processed, the (mtime, size) of both files and a signature of
+the settings the pair was diffed with. A later run can skip such a pair with
+two stats instead of parsing and diffing both files.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+# Bump when the on-disk layout changes; older state files are ignored
+STATE_VERSION = 1
+
+DEFAULT_STATE_FILE = '.sceptre-sync-cache.json'
+
+
+def file_stamp(file_path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SyncState:
+    """(source, target) -> file stamps of pairs that were last seen in sync."""
+
+    def __init__(self, state_file: str):
+        """
+        Load the state file, starting empty if it is missing or unreadable.
+
+        Args:
+            state_file: Path to the JSON state file
+        """
+        self.state_file = state_file
+        self.entries: Dict[str, List] = {}
+        self.dirty = False
+
+        try:
+            with open(state_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get('version') == STATE_VERSION:
+            entries = data.get('entries')
+            if isinstance(entries, dict):
+                self.entries = entries
+
+    @staticmethod
+    def _key(source_file: str, target_file: str) -> str:
+        return f"{os.path.abspath(source_file)}\0{os.path.abspath(target_file)}"
+
+    def _stamps(self, source_file: str, target_file: str,
+                signature: str) -> Optional[List]:
+        source_stamp = file_stamp(source_file)
+        target_stamp = file_stamp(target_file)
+        if source_stamp is None or target_stamp is None:
+            return None
+        return [signature, *source_stamp, *target_stamp]
+
+    def is_current(self, source_file: str, target_file: str, signature: str) -> bool:
+        """
+        Check whether a pair is unchanged since it was recorded as in sync.
+
+        Args:
+            source_file: Path to the source YAML file
+            target_file: Path to the target YAML file
+            signature: Settings the pair is being diffed with
+
+        Returns:
+            True if both files and the settings match the recorded entry
+        """
+        entry = self.entries.get(self._key(source_file, target_file))
+        return entry is not None and entry == self._stamps(source_file, target_file, signature)
+
+    def record(self, source_file: str, target_file: str, signature: str) -> None:
+        """
+        Record a pair as in sync with the files as they are now.
+
+        Args:
+            source_file: Path to the source YAML file
+            target_file: Path to the target YAML file
+            signature: Settings the pair was diffed with
+        """
+        stamps = self._stamps(source_file, target_file, signature)
+        if stamps is not None:
+            self.entries[self._key(source_file, target_file)] = stamps
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the state file if anything was recorded (best effort)."""
+        if not self.dirty:
+            return
+        tmp_file = f"{self.state_file}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({'version': STATE_VERSION, 'entries': self.entries}, f)
+            os.replace(tmp_file, self.state_file)
+        except OSError:
+            return
+        self.dirty = False
@@ -4,6 +4,7 @@ setup(
     name="sceptre_sync",
     version="0.1.0",
     packages=find_packages(),
+    python_requires=">=3.7",
     install_requires=[
         "ruamel.yaml>=0.17.0",
         "jsonschema>=3.2.0",
@@ -23,9 +24,10 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
     ],
 )
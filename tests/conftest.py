@@ -5,6 +5,7 @@ Because repeating yourself in tests is like using the same password everywhere -
 technically works, but you're setting yourself up for pain.
 """
 
+import logging
 import pytest
 import tempfile
 import shutil
@@ -14,6 +15,8 @@ from io import StringIO
 from contextlib import contextmanager
 from unittest.mock import Mock
 
+from sceptre_sync.common import enable_debug_logging
+
 
 @pytest.fixture
 def temp_dir():
@@ -237,6 +240,17 @@ def mock_bulk_sync_summary():
     }
 
 
+@pytest.fixture
+def debug_logging():
+    """Turn on --verbose style debug logging, undoing it afterwards."""
+    package_logger = logging.getLogger('sceptre_sync')
+    level, handlers = package_logger.level, list(package_logger.handlers)
+    enable_debug_logging()
+    yield
+    package_logger.setLevel(level)
+    package_logger.handlers[:] = handlers
+
+
 # Register custom markers to avoid warnings
 def pytest_configure(config):
     """Register custom pytest markers."""
@@ -5,13 +5,20 @@ Because testing one file at a time is like eating soup with a fork -
 technically possible but missing the entire point.
 """
 
+import glob
+import io
+import json
 import os
 import pytest
+import sys
 from pathlib import Path
 import tempfile
+import threading
+import time
 
 import ruamel.yaml
-from sceptre_sync.bulk_sync import BulkParamSync
+from sceptre_sync.bulk_sync import (BulkParamSync, SyncSummary, _buffered_stdout,
+                                    _prefetch_files)
 
 
 class TestBulkSync:
@@ -397,3 +404,558 @@ parameters:
             assert result['parameters']['InstanceType'] == "t3.large"
             assert result['parameters']['Environment'] == "production"  # Static override
             assert result['parameters']['StackName'] == stack  # Preserved
+
+
+class TestFindMatchingFiles:
+    """Test the scandir-based pattern expansion against the stdlib glob."""
+
+    @pytest.fixture
+    def config_tree(self, temp_dir):
+        """Create a small Sceptre-style config tree."""
+        for rel in [
+            "config/di-alpha/vpc.yaml",
+            "config/di-alpha/app/web.yaml",
+            "config/di-alpha/app/api/tasks/worker.yaml",
+            "config/di-alpha/app/notes.txt",
+            "config/di-alpha/.hidden/secret.yaml",
+            "config/di-alpha/.env.yaml",
+            "config/di-dev/vpc.yaml",
+        ]:
+            path = os.path.join(temp_dir, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write("parameters: {}\n")
+        return temp_dir
+
+    @pytest.mark.parametrize("pattern", [
+        "config/di-alpha/*.yaml",
+        "config/di-alpha/**/*.yaml",
+        "config/**/vpc.yaml",
+        "config/*/app/web.yaml",
+        "config/di-*/vpc.yaml",
+        "config/di-alpha/.*.yaml",
+        "config/di-alpha/app/w?b.yaml",
+        "config/di-alpha/[av]*.yaml",
+        "config/di-alpha/**",
+        "config/di-alpha/vpc.yaml",
+        "config/missing/**/*.yaml",
+        "config/di-alpha/vpc.yaml/*.yaml",
+        "config/*/",
+        "config/di-alpha/*/",
+        "config/di-alpha/**/",
+        "config/**/app/",
+        "config/di-*/app/",
+        "config/di-alpha/*.yaml/",
+    ])
+    def test_matches_stdlib_glob(self, config_tree, pattern):
+        """Test that results match glob.glob(recursive=True)."""
+        full_pattern = os.path.join(config_tree, pattern)
+        bulk_sync = BulkParamSync()
+
+        result = bulk_sync.find_matching_files(full_pattern)
+
+        assert sorted(result) == sorted(glob.glob(full_pattern, recursive=True))
+
+    def test_relative_pattern(self, config_tree, monkeypatch):
+        """Test that relative patterns resolve against the working directory."""
+        monkeypatch.chdir(config_tree)
+        bulk_sync = BulkParamSync()
+
+        result = bulk_sync.find_matching_files("**/vpc.yaml")
+
+        assert sorted(result) == sorted(glob.glob("**/vpc.yaml", recursive=True))
+
+    def test_does_not_follow_symlinked_directories(self, config_tree):
+        """Test that ** recursion skips symlinked directories."""
+        link = os.path.join(config_tree, "config/di-alpha/loop")
+        try:
+            os.symlink(os.path.join(config_tree, "config"), link)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+        bulk_sync = BulkParamSync()
+
+        result = bulk_sync.find_matching_files(
+            os.path.join(config_tree, "config/di-alpha/**/*.yaml")
+        )
+
+        assert not any(os.sep + "loop" + os.sep in path for path in result)
+        assert os.path.join(config_tree, "config/di-alpha/app/web.yaml") in result
+
+    def test_literal_pattern_does_not_scan(self, tmp_path, monkeypatch):
+        """Test that a wildcard-free pattern is resolved without listing directories."""
+        yaml_file = tmp_path / "stack.yaml"
+        yaml_file.write_text("test: 1")
+
+        bulk_sync = BulkParamSync()
+
+        def no_scandir(*args, **kwargs):
+            raise AssertionError("literal pattern should not scan directories")
+
+        monkeypatch.setattr('sceptre_sync.bulk_sync._scandir', no_scandir)
+
+        assert bulk_sync.find_matching_files(str(yaml_file)) == [str(yaml_file)]
+        assert bulk_sync.find_matching_files(str(tmp_path / "missing.yaml")) == []
+
+
+class TestGenerateFilePairs:
+    """Test how source files are paired with target files."""
+
+    def test_pairs_by_filename_with_uneven_counts(self, tmp_path):
+        """Test filename matching when source and target counts differ."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "tgt" / "a").mkdir(parents=True)
+        (tmp_path / "tgt" / "b").mkdir(parents=True)
+        for name in ("vpc.yaml", "app.yaml", "db.yaml"):
+            (tmp_path / "src" / name).write_text("test: 1")
+        (tmp_path / "tgt" / "a" / "vpc.yaml").write_text("test: 2")
+        (tmp_path / "tgt" / "b" / "app.yaml").write_text("test: 3")
+
+        pairs = BulkParamSync().generate_file_pairs(
+            str(tmp_path / "src" / "*.yaml"),
+            str(tmp_path / "tgt" / "**" / "*.yaml")
+        )
+
+        assert sorted(pairs) == sorted([
+            (str(tmp_path / "src" / "vpc.yaml"), str(tmp_path / "tgt" / "a" / "vpc.yaml")),
+            (str(tmp_path / "src" / "app.yaml"), str(tmp_path / "tgt" / "b" / "app.yaml")),
+        ])
+
+    def test_environment_mapping_skips_missing_targets(self, tmp_path, capsys):
+        """Test that env-mapped targets are paired only when they exist."""
+        for env in ("di-alpha", "di-beta"):
+            (tmp_path / env / "app").mkdir(parents=True)
+        for rel in ("vpc.yaml", "db.yaml", "app/web.yaml", "app/api.yaml"):
+            (tmp_path / "di-alpha" / rel).write_text("test: 1")
+        for rel in ("vpc.yaml", "app/api.yaml"):
+            (tmp_path / "di-beta" / rel).write_text("test: 2")
+        (tmp_path / "di-beta" / "db.yaml").mkdir()
+
+        pairs = BulkParamSync().generate_file_pairs(
+            str(tmp_path / "di-alpha" / "**" / "*.yaml"),
+            str(tmp_path / "di-beta" / "**" / "*.yaml")
+        )
+
+        assert sorted(pairs) == sorted([
+            (str(tmp_path / "di-alpha" / "vpc.yaml"), str(tmp_path / "di-beta" / "vpc.yaml")),
+            (str(tmp_path / "di-alpha" / "app" / "api.yaml"),
+             str(tmp_path / "di-beta" / "app" / "api.yaml")),
+            (str(tmp_path / "di-alpha" / "db.yaml"), str(tmp_path / "di-beta" / "db.yaml")),
+        ])
+        assert f"Target file not found: {tmp_path / 'di-beta' / 'app' / 'web.yaml'}" in capsys.readouterr().out
+
+    def test_quiet_mode_only_counts_missing_targets(self, tmp_path, capsys):
+        """Test that missing targets are summarised rather than listed unless verbose."""
+        (tmp_path / "di-alpha").mkdir()
+        (tmp_path / "di-beta").mkdir()
+        for name in ("vpc.yaml", "db.yaml", "app.yaml"):
+            (tmp_path / "di-alpha" / name).write_text("test: 1")
+        (tmp_path / "di-beta" / "vpc.yaml").write_text("test: 2")
+
+        pairs = BulkParamSync(verbose=False).generate_file_pairs(
+            str(tmp_path / "di-alpha" / "*.yaml"),
+            str(tmp_path / "di-beta" / "*.yaml")
+        )
+
+        out = capsys.readouterr().out
+        assert len(pairs) == 1
+        assert "Target file not found" not in out
+        assert "2 target files not found (use --verbose to list them)" in out
+
+
+class TestParallelBulkSync:
+    """Test diffing file pairs in a process pool."""
+
+    @pytest.fixture
+    def many_pairs(self, tmp_path):
+        """Create several source/target pairs and a multi-key config."""
+        (tmp_path / "di-dev").mkdir()
+        (tmp_path / "di-prod").mkdir()
+        for i in range(6):
+            (tmp_path / "di-dev" / f"stack-{i}.yaml").write_text(
+                f"parameters:\n  InstanceType: t3.large\n  Index: {i}\n"
+            )
+            (tmp_path / "di-prod" / f"stack-{i}.yaml").write_text(
+                f"# prod stack {i}\nparameters:\n  InstanceType: t2.micro\n  Index: {i}\n"
+            )
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+template_patterns:
+  - pattern: "*.yaml"
+    sync_rules:
+      - key: parameters
+        sync_params: [InstanceType]
+""")
+        return tmp_path, str(config_file)
+
+    def test_parallel_yes_to_all_applies_every_pair(self, many_pairs, capsys):
+        """Test that pool-computed diffs are applied and reported in pair order."""
+        tmp_path, config_file = many_pairs
+        bulk_sync = BulkParamSync(config_file, max_workers=2)
+        bulk_sync.parallel_threshold = 1
+
+        summary = bulk_sync.sync_bulk(
+            str(tmp_path / "di-dev" / "*.yaml"),
+            str(tmp_path / "di-prod" / "*.yaml"),
+            interactive=False,
+            yes_to_all=True
+        )
+
+        assert summary['total_files'] == 6
+        assert summary['changed_files'] == 6
+        assert summary['total_changes'] == 6
+        for i in range(6):
+            content = (tmp_path / "di-prod" / f"stack-{i}.yaml").read_text()
+            assert content.startswith(f"# prod stack {i}\n")
+            assert "InstanceType: t3.large" in content
+
+        out = capsys.readouterr().out
+        processing = [line for line in out.splitlines() if line.startswith("Processing:")]
+        sources = [line.split()[1] for line in processing]
+        assert len(sources) == 6
+        assert all(f"Using multi-key sync rules for {source}" in out for source in sources)
+
+    def test_workers_use_programmatic_config(self, tmp_path, capsys):
+        """Test that pool workers get the rules set on param_sync, not re-read from disk."""
+        (tmp_path / "di-dev").mkdir()
+        (tmp_path / "di-prod").mkdir()
+        pair_count = 40
+        for i in range(pair_count):
+            (tmp_path / "di-dev" / f"stack-{i}.yaml").write_text(
+                "parameters:\n  InstanceType: t3.large\n"
+            )
+            (tmp_path / "di-prod" / f"stack-{i}.yaml").write_text(
+                "parameters:\n  InstanceType: t2.micro\n"
+            )
+        bulk_sync = BulkParamSync(max_workers=2)
+        bulk_sync.param_sync.config = {'template_patterns': [
+            {'pattern': '*.yaml', 'sync_params': ['InstanceType']}
+        ]}
+        assert pair_count >= bulk_sync.parallel_threshold
+
+        bulk_sync.sync_bulk(
+            str(tmp_path / "di-dev" / "*.yaml"),
+            str(tmp_path / "di-prod" / "*.yaml"),
+            dry_run=True,
+            interactive=False
+        )
+
+        out = capsys.readouterr().out
+        assert "No sync parameters" not in out
+        assert out.count("~ InstanceType: t2.micro -> t3.large") == pair_count
+
+    def test_worker_debug_lines_are_replayed_with_their_pair(self, many_pairs, capsys,
+                                                             debug_logging):
+        """Test that worker filter logs come back in the pair's output, naming the file."""
+        tmp_path, config_file = many_pairs
+        bulk_sync = BulkParamSync(config_file, max_workers=2)
+        bulk_sync.parallel_threshold = 1
+
+        bulk_sync.sync_bulk(
+            str(tmp_path / "di-dev" / "*.yaml"),
+            str(tmp_path / "di-prod" / "*.yaml"),
+            dry_run=True,
+            interactive=False,
+            filter_spec="parameters.InstanceType:t3"
+        )
+
+        lines = capsys.readouterr().out.splitlines()
+        processing = [i for i, line in enumerate(lines) if line.startswith("Processing:")]
+        assert len(processing) == 6
+        for start, end in zip(processing, processing[1:] + [len(lines)]):
+            source = lines[start].split()[1]
+            assert f"{source}: Filter match: 't3' found in 't3.large'" in lines[start:end]
+
+    def test_parallel_run_skips_prefetch_threads(self, many_pairs, monkeypatch):
+        """Test that no prefetch threads are left running when the pool forks."""
+        tmp_path, config_file = many_pairs
+        bulk_sync = BulkParamSync(config_file, max_workers=2)
+        bulk_sync.parallel_threshold = 1
+
+        def no_prefetch(paths):
+            raise AssertionError("prefetch started before forking a process pool")
+
+        monkeypatch.setattr('sceptre_sync.bulk_sync._prefetch_files', no_prefetch)
+
+        summary = bulk_sync.sync_bulk(
+            str(tmp_path / "di-dev" / "*.yaml"),
+            str(tmp_path / "di-prod" / "*.yaml"),
+            dry_run=True,
+            interactive=False
+        )
+
+        assert summary['total_files'] == 6
+
+    def test_interactive_run_stays_in_process(self, many_pairs, monkeypatch):
+        """Test that runs needing prompts never start a process pool."""
+        tmp_path, config_file = many_pairs
+        bulk_sync = BulkParamSync(config_file, max_workers=2)
+        bulk_sync.parallel_threshold = 1
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool used for an interactive run")
+
+        monkeypatch.setattr('sceptre_sync.common.ProcessPoolExecutor', no_pool)
+        monkeypatch.setattr('builtins.input', lambda _: 'n')
+
+        summary = bulk_sync.sync_bulk(
+            str(tmp_path / "di-dev" / "*.yaml"),
+            str(tmp_path / "di-prod" / "*.yaml"),
+        )
+
+        assert summary['total_files'] == 6
+        assert summary['changed_files'] == 0
+
+    def test_worker_load_error_exits_in_parent(self, many_pairs, capsys):
+        """Test that a YAML error in a worker surfaces as SystemExit in the caller."""
+        tmp_path, config_file = many_pairs
+        (tmp_path / "di-dev" / "stack-3.yaml").write_text("parameters: [unclosed\n")
+        bulk_sync = BulkParamSync(config_file, max_workers=2)
+        bulk_sync.parallel_threshold = 1
+
+        with pytest.raises(SystemExit) as exc_info:
+            bulk_sync.sync_bulk(
+                str(tmp_path / "di-dev" / "*.yaml"),
+                str(tmp_path / "di-prod" / "*.yaml"),
+                dry_run=True,
+                interactive=False
+            )
+
+        assert exc_info.value.code == 1
+        assert "Error loading YAML file" in capsys.readouterr().err
+
+
+class TestPrefetch:
+    """Test background page-cache prefetching of bulk sync inputs."""
+
+    @pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason="posix_fadvise unavailable")
+    def test_prefetch_advises_willneed_for_each_file(self, tmp_path, monkeypatch):
+        """Test that every existing file gets a WILLNEED hint and missing ones are skipped."""
+        paths = []
+        for name in ("a.yaml", "b.yaml"):
+            (tmp_path / name).write_text("test: 1")
+            paths.append(str(tmp_path / name))
+        advice = []
+        monkeypatch.setattr(os, 'posix_fadvise',
+                            lambda fd, offset, length, flag: advice.append(flag))
+
+        executor = _prefetch_files(paths + [str(tmp_path / "missing.yaml")])
+        executor.shutdown(wait=True)
+
+        assert advice == [os.POSIX_FADV_WILLNEED] * 2
+
+    @pytest.mark.parametrize("broken", [False, True])
+    def test_serial_run_joins_prefetch_threads(self, tmp_path, monkeypatch, broken):
+        """Test that no prefetch thread outlives a run, even one cut short by a load error."""
+        # Slow disk: prefetching is still going on when the diffs are done
+        monkeypatch.setattr('sceptre_sync.bulk_sync._prefetch_file',
+                            lambda path: time.sleep(0.05))
+        (tmp_path / "dev").mkdir()
+        (tmp_path / "prod").mkdir()
+        for i in range(12):
+            (tmp_path / "dev" / f"stack-{i}.yaml").write_text("parameters:\n  Size: large\n")
+            (tmp_path / "prod" / f"stack-{i}.yaml").write_text("parameters:\n  Size: small\n")
+        if broken:
+            (tmp_path / "dev" / "stack-0.yaml").write_text("parameters: [unclosed\n")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("template_patterns:\n  - pattern: \"*.yaml\"\n"
+                               "    sync_rules:\n      - key: parameters\n"
+                               "        sync_params: [Size]\n")
+        bulk_sync = BulkParamSync(str(config_file), max_workers=1)
+        threads_before = set(threading.enumerate())
+
+        try:
+            bulk_sync.sync_bulk(str(tmp_path / "dev" / "*.yaml"),
+                                str(tmp_path / "prod" / "*.yaml"),
+                                dry_run=True, interactive=False)
+        except SystemExit:
+            assert broken
+
+        assert set(threading.enumerate()) <= threads_before
+
+
+
+class TestSyncStateSkipping:
+    """Test that a state file lets re-runs skip pairs already in sync."""
+
+    @pytest.fixture
+    def pairs(self, tmp_path):
+        """Create two out-of-sync pairs and a multi-key config."""
+        (tmp_path / "di-dev").mkdir()
+        (tmp_path / "di-prod").mkdir()
+        for name in ("vpc", "db"):
+            (tmp_path / "di-dev" / f"{name}.yaml").write_text("parameters:\n  Size: large\n")
+            (tmp_path / "di-prod" / f"{name}.yaml").write_text("parameters:\n  Size: small\n")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+template_patterns:
+  - pattern: "*.yaml"
+    sync_rules:
+      - key: parameters
+        sync_params: [Size]
+""")
+        return tmp_path, str(config_file)
+
+    def run(self, tmp_path, config_file, **kwargs):
+        bulk_sync = BulkParamSync(config_file, state_file=str(tmp_path / "state.json"))
+        return bulk_sync.sync_bulk(
+            str(tmp_path / "di-dev" / "*.yaml"),
+            str(tmp_path / "di-prod" / "*.yaml"),
+            interactive=False,
+            **kwargs
+        )
+
+    def test_unchanged_pairs_are_skipped_on_rerun(self, pairs, capsys):
+        """Test that applied pairs are not diffed again until a file changes."""
+        tmp_path, config_file = pairs
+
+        assert self.run(tmp_path, config_file, yes_to_all=True)['changed_files'] == 2
+        capsys.readouterr()
+
+        self.run(tmp_path, config_file, yes_to_all=True)
+        out = capsys.readouterr().out
+        assert "Skipping 2 file pairs unchanged since they were last in sync." in out
+        assert "Processing:" not in out
+
+        source = tmp_path / "di-dev" / "db.yaml"
+        source.write_text("parameters:\n  Size: xlarge\n")
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        summary = self.run(tmp_path, config_file, yes_to_all=True)
+        out = capsys.readouterr().out
+        assert "Skipping 1 file pairs" in out
+        assert summary['changed_files'] == 1
+        assert "Size: xlarge" in (tmp_path / "di-prod" / "db.yaml").read_text()
+
+    def test_dry_run_changes_are_not_recorded(self, pairs, capsys):
+        """Test that pairs with pending changes are diffed again next time."""
+        tmp_path, config_file = pairs
+
+        self.run(tmp_path, config_file, dry_run=True)
+        capsys.readouterr()
+
+        self.run(tmp_path, config_file, dry_run=True)
+        out = capsys.readouterr().out
+        assert "Skipping" not in out
+        assert out.count("Processing:") == 2
+
+
+class TestBufferedOutput:
+    """Test that non-interactive runs batch their per-pair output."""
+
+    class CountingStream:
+        """Minimal text stream recording each write it receives."""
+
+        def __init__(self):
+            self.writes = []
+
+        def write(self, text):
+            self.writes.append(text)
+            return len(text)
+
+        def flush(self):
+            pass
+
+    def test_per_pair_output_is_written_in_one_chunk(self, tmp_path, monkeypatch):
+        """Test that progress lines for all pairs reach stdout in a single write."""
+        (tmp_path / "di-dev").mkdir()
+        (tmp_path / "di-prod").mkdir()
+        for name in ("vpc", "db", "app"):
+            (tmp_path / "di-dev" / f"{name}.yaml").write_text("parameters:\n  Size: large\n")
+            (tmp_path / "di-prod" / f"{name}.yaml").write_text("parameters:\n  Size: small\n")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text('template_patterns:\n  - pattern: "*.yaml"\n    sync_params: [Size]\n')
+        bulk_sync = BulkParamSync(str(config_file))
+
+        stream = self.CountingStream()
+        monkeypatch.setattr(sys, 'stdout', stream)
+        bulk_sync.sync_bulk(
+            str(tmp_path / "di-dev" / "*.yaml"),
+            str(tmp_path / "di-prod" / "*.yaml"),
+            dry_run=True,
+            interactive=False
+        )
+
+        chunks = [text for text in stream.writes if "Processing:" in text]
+        assert len(chunks) == 1
+        assert chunks[0].count("Processing:") == 3
+
+    def test_stderr_writes_flush_buffered_stdout_first(self, monkeypatch):
+        """Test that stdout and stderr sharing a terminal stay in order."""
+        terminal = io.StringIO()
+        monkeypatch.setattr(sys, 'stdout', terminal)
+        monkeypatch.setattr(sys, 'stderr', terminal)
+
+        with _buffered_stdout():
+            print("first")
+            print("second", file=sys.stderr)
+            print("third")
+
+        assert terminal.getvalue() == "first\nsecond\nthird\n"
+
+    def test_verbose_lines_interleave_with_pair_output(self, tmp_path, capsys, debug_logging):
+        """Test that filter logs in a buffered run sit between their pair's lines."""
+        (tmp_path / "di-dev").mkdir()
+        (tmp_path / "di-prod").mkdir()
+        for name in ("a", "b"):
+            (tmp_path / "di-dev" / f"{name}.yaml").write_text(
+                f"template:\n  type: vpc-{name}\nparameters:\n  Cidr: 10.0.0.0/16\n"
+            )
+            (tmp_path / "di-prod" / f"{name}.yaml").write_text("parameters:\n  Cidr: 10.1.0.0/16\n")
+        bulk_sync = BulkParamSync(max_workers=1)
+        bulk_sync.param_sync.config = {'template_patterns': [
+            {'pattern': '*.yaml', 'sync_params': ['Cidr']}
+        ]}
+
+        bulk_sync.sync_bulk(
+            str(tmp_path / "di-dev" / "*.yaml"),
+            str(tmp_path / "di-prod" / "*.yaml"),
+            dry_run=True,
+            interactive=False,
+            filter_spec="template.type:vpc"
+        )
+
+        lines = capsys.readouterr().out.splitlines()
+        for name in ("a", "b"):
+            source = str(tmp_path / "di-dev" / f"{name}.yaml")
+            start = lines.index(f"Processing: {source} -> {source.replace('di-dev', 'di-prod')}")
+            end = next((i for i in range(start + 1, len(lines))
+                        if lines[i].startswith("Processing:")), len(lines))
+            assert f"{source}: Filter match: 'vpc' found in 'vpc-{name}'" in lines[start:end]
+
+
+class TestSyncSummary:
+    """Test the bulk sync summary container."""
+
+    def test_summary_reads_like_the_old_dict(self):
+        """Test that callers using dict-style access keep working."""
+        summary = SyncSummary(total_files=3, changed_files=1, total_changes=4,
+                              filtered_files=0, file_changes={'a.yaml': 4})
+
+        assert summary['total_files'] == 3
+        assert 'filtered_files' in summary
+        assert 'missing' not in summary
+        assert dict(summary) == {
+            'total_files': 3, 'changed_files': 1, 'total_changes': 4,
+            'filtered_files': 0, 'file_changes': {'a.yaml': 4}
+        }
+        with pytest.raises(KeyError):
+            summary['missing']
+        with pytest.raises(AttributeError):
+            summary.unexpected = 1
+
+    def test_summary_supports_remaining_dict_idioms(self):
+        """Test get, items, equality with a dict and JSON export via as_dict."""
+        old = {
+            'total_files': 2, 'changed_files': 2, 'total_changes': 3,
+            'filtered_files': 0, 'file_changes': {'a.yaml': 1, 'b.yaml': 2}
+        }
+        summary = SyncSummary(**old)
+
+        assert summary.get('changed_files') == 2
+        assert summary.get('missing', 'n/a') == 'n/a'
+        assert dict(summary.items()) == old
+        assert summary == old
+        assert summary != {**old, 'total_changes': 4}
+        assert summary == SyncSummary(**old)
+        assert json.loads(json.dumps(summary.as_dict())) == old
@@ -12,6 +12,7 @@ from io import StringIO
 import sys
 
 from sceptre_sync.cli import main
+from sceptre_sync.sync_state import DEFAULT_STATE_FILE
 
 
 class TestCLI:
@@ -199,7 +200,8 @@ class TestCLI:
         
         # Verify
         assert exit_code == 0
-        mock_bulk_sync_class.assert_called_once_with("config.yaml")
+        mock_bulk_sync_class.assert_called_once_with("config.yaml", max_workers=None, verbose=False,
+                                                     state_file=None)
         mock_bulk_sync.sync_bulk.assert_called_once_with(
             "*/alpha/*.yaml",
             "*/dev/*.yaml",
@@ -279,6 +281,47 @@ class TestCLI:
         # Should not show filtered files line when none are filtered
         assert "Files filtered out:" not in captured.out
 
+    @patch('sceptre_sync.cli.enable_debug_logging')
+    @patch('sceptre_sync.cli.BulkParamSync')
+    def test_bulk_command_verbose_enables_debug_logging(self, mock_bulk_sync_class,
+                                                        mock_enable_debug_logging,
+                                                        mock_bulk_sync_summary):
+        """Test that bulk --verbose means the same as in sceptre_sync.bulk_sync."""
+        mock_bulk_sync_class.return_value.sync_bulk.return_value = mock_bulk_sync_summary
+
+        assert main(["bulk", "-s", "*.yaml", "-t", "target/*.yaml",
+                     "-c", "config.yaml", "--verbose"]) == 0
+        mock_enable_debug_logging.assert_called_once_with()
+        mock_bulk_sync_class.assert_called_once_with("config.yaml", max_workers=None,
+                                                     verbose=True, state_file=None)
+
+    @patch('sceptre_sync.cli.BulkParamSync')
+    def test_bulk_command_workers(self, mock_bulk_sync_class, mock_bulk_sync_summary, capsys):
+        """Test that --workers sets the pool size and rejects values below one."""
+        mock_bulk_sync_class.return_value.sync_bulk.return_value = mock_bulk_sync_summary
+        args = ["bulk", "-s", "*.yaml", "-t", "target/*.yaml", "-c", "config.yaml"]
+
+        assert main(args + ["--workers", "1"]) == 0
+        mock_bulk_sync_class.assert_called_once_with("config.yaml", max_workers=1, verbose=False,
+                                                     state_file=None)
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(args + ["--workers", "0"])
+        assert exc_info.value.code == 2
+        assert "--workers must be at least 1" in capsys.readouterr().err
+
+    @patch('sceptre_sync.cli.BulkParamSync')
+    def test_bulk_command_state_file(self, mock_bulk_sync_class, mock_bulk_sync_summary):
+        """Test that --state-file is forwarded, with the default path when given bare."""
+        mock_bulk_sync_class.return_value.sync_bulk.return_value = mock_bulk_sync_summary
+        args = ["bulk", "-s", "*.yaml", "-t", "target/*.yaml", "-c", "config.yaml"]
+
+        assert main(args + ["--state-file", "state.json"]) == 0
+        assert mock_bulk_sync_class.call_args.kwargs['state_file'] == "state.json"
+
+        assert main(args + ["--state-file"]) == 0
+        assert mock_bulk_sync_class.call_args.kwargs['state_file'] == DEFAULT_STATE_FILE
+
     def test_invalid_command_shows_help(self, capsys):
         """Test that invalid command shows help."""
         with pytest.raises(SystemExit) as exc_info:
@@ -378,3 +421,47 @@ class TestCLI:
         assert "--target-pattern" in captured.out
         assert "--source-pattern" in captured.out
         assert "--non-interactive" in captured.out
+
+    def test_help_does_not_import_yaml_library(self):
+        """Test that showing help does not load ruamel.yaml."""
+        import os
+        import subprocess
+
+        code = (
+            "import sys\n"
+            "from sceptre_sync.cli import main\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "sys.exit('ruamel.yaml' in sys.modules)\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, cwd=repo_root)
+
+        assert result.returncode == 0
+
+    def test_help_does_not_import_yaml_library_with_clib(self, tmp_path):
+        """Test that help stays lazy and quiet when ruamel.yaml.clib is importable."""
+        import os
+        import subprocess
+
+        # Stand-in for the C extension, which imports ruamel.yaml when loaded
+        (tmp_path / "_ruamel_yaml.py").write_text("import ruamel.yaml\n")
+        code = (
+            "import sys\n"
+            "from sceptre_sync.cli import main\n"
+            "from sceptre_sync.param_sync import HAS_LIBYAML\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "sys.exit(not HAS_LIBYAML or 'ruamel.yaml' in sys.modules)\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(tmp_path), repo_root]))
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                                text=True, cwd=repo_root, env=env)
+
+        assert result.returncode == 0
+        assert "Warning" not in result.stderr
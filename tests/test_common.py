@@ -6,7 +6,33 @@ before building the house.
 """
 
 import pytest
-from sceptre_sync.common import format_diff_summary, calculate_total_changes
+import fnmatch
+import sys
+
+from sceptre_sync.common import (
+    calculate_total_changes, compile_glob, count_changes, format_diff_summary,
+    glob_match, run_in_pool, values_differ
+)
+from ruamel.yaml import YAML
+from ruamel.yaml.comments import CommentedMap
+
+
+_offset = 0
+
+
+def _set_offset(offset):
+    """Pool initializer for the run_in_pool tests."""
+    global _offset
+    _offset = offset
+
+
+def _shout(n):
+    """Pool task for the run_in_pool tests: print, then fail on 3."""
+    print(f"task {n}")
+    print(f"warn {n}", file=sys.stderr)
+    if n == 3:
+        raise SystemExit(1)
+    return n + _offset
 
 
 class TestCommon:
@@ -71,3 +97,87 @@ class TestCommon:
         assert "0 modifications" in result
         assert "2 deletions" in result
         assert "1 template changes" in result
+
+    @pytest.mark.parametrize("name,pattern", [
+        ("config/dev/vpc.yaml", "*/vpc.yaml"),
+        ("config/dev/vpc.yaml", "**/vpc.yaml"),
+        ("config/dev/api/tasks/worker.yaml", "*/api/tasks/*.yaml"),
+        ("config/dev/vpc.yaml", "*/app.yaml"),
+        ("vpc.yaml", "v?c.[xy]aml"),
+    ])
+    def test_glob_match_agrees_with_fnmatch(self, name, pattern):
+        """Test that glob_match gives the same answer as fnmatch.fnmatch."""
+        assert glob_match(name, pattern) == fnmatch.fnmatch(name, pattern)
+
+    def test_compile_glob_reuses_compiled_pattern(self):
+        """Test that repeat patterns are compiled only once."""
+        assert compile_glob("*/vpc.yaml") is compile_glob("*/vpc.yaml")
+
+    def test_count_changes_multi_key(self):
+        """Test counting changes across several keys of a multi-key diff."""
+        diff = {
+            'parameters': {
+                'added': {'A': 1}, 'modified': {'B': {'old': 1, 'new': 2}},
+                'unchanged': {'C': 3}, 'deleted': {}
+            },
+            'stack_tags': {
+                'added': {'Owner': 'x', 'Team': 'y'}, 'modified': {},
+                'unchanged': {}, 'deleted': {'Old': 'z'}
+            },
+            'template': {'old': 'a', 'new': 'b'}
+        }
+        assert count_changes(diff) == (3, 1, 1, 1)
+        assert calculate_total_changes(diff) == 6
+        assert format_diff_summary(diff) == (
+            "Applied 6 changes (3 additions, 1 modifications, "
+            "1 deletions, 1 template changes)"
+        )
+
+    def test_count_changes_empty_diff(self):
+        """Test that a filtered-out (empty) diff counts as no changes."""
+        assert count_changes({}) == (0, 0, 0, 0)
+
+    @pytest.mark.parametrize("source, target, expected", [
+        (80, "80", False),
+        ("t3.large", "t3.large", False),
+        ("t3.large", "t2.micro", True),
+        ({'a': [1, 2]}, {'a': [1, 2]}, False),
+        ({'a': [1, 2]}, {'a': [1, 3]}, True),
+        ({'a': 1}, {'a': 1, 'b': 2}, True),
+        ([1, 2], [1, 2, 3], True),
+        (CommentedMap([('a', 1), ('b', 2)]), CommentedMap([('b', 2), ('a', 1)]), True),
+    ])
+    def test_values_differ_matches_string_comparison(self, source, target, expected):
+        """Test that values_differ agrees with comparing str() forms."""
+        assert values_differ(source, target) is expected
+        assert values_differ(source, target) == (str(source) != str(target))
+
+    def test_values_differ_with_round_trip_scalars(self):
+        """Test that quoting style and int subclasses don't count as differences."""
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        source = yaml.load('Name: "web"\nPort: 0x50\nCount: 3\n')
+        target = yaml.load('Name: web\nPort: 80\nCount: 4\n')
+
+        assert values_differ(source['Name'], target['Name']) is False
+        assert values_differ(source['Port'], target['Port']) is False
+        assert values_differ(source['Count'], target['Count']) is True
+
+    def test_run_in_pool_replays_output_in_task_order(self, capsys):
+        """Test that results and worker output come back in task order."""
+        results = list(run_in_pool(_shout, [0, 1, 2], max_workers=2,
+                                   initializer=_set_offset, initargs=(10,)))
+
+        assert results == [10, 11, 12]
+        captured = capsys.readouterr()
+        assert captured.out == "task 0\ntask 1\ntask 2\n"
+        assert captured.err == "warn 0\nwarn 1\nwarn 2\n"
+
+    def test_run_in_pool_reraises_after_output(self, capsys):
+        """Test that a worker's exception surfaces here after its output."""
+        results = run_in_pool(_shout, [2, 3, 4], max_workers=2)
+
+        assert next(results) == 2
+        with pytest.raises(SystemExit):
+            next(results)
+        assert capsys.readouterr().out == "task 2\ntask 3\n"
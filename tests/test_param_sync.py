@@ -5,13 +5,15 @@ Testing the core parameter synchronization logic because YAML manipulation
 is like brain surgery with a spoon - precision matters.
 """
 
+import logging
 import os
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 
 import ruamel.yaml
-from sceptre_sync.param_sync import ParamSync
+from sceptre_sync.common import compile_glob
+from sceptre_sync.param_sync import ParamSync, _parse_filter
 
 
 class TestParamSync:
@@ -32,7 +34,68 @@ class TestParamSync:
         sync = ParamSync(config_file)
         assert 'template_patterns' in sync.config
         assert len(sync.config['template_patterns']) == 2
-    
+
+    def test_config_loaded_with_safe_loader(self, temp_dir, yaml_content):
+        """Test that the rules file is parsed into plain dicts, not round-trip maps."""
+        config_file = os.path.join(temp_dir, "config.yaml")
+        with open(config_file, 'w') as f:
+            f.write(yaml_content['config_with_delete'])
+
+        sync = ParamSync(config_file)
+        assert type(sync.config) is dict
+        assert type(sync.config['template_patterns'][0]) is dict
+
+    def test_pattern_matches_are_memoized_per_config(self, temp_dir, yaml_content):
+        """Test that patterns compile once per config and paths match once each."""
+        config_file = os.path.join(temp_dir, "config.yaml")
+        with open(config_file, 'w') as f:
+            f.write(yaml_content['config_with_delete'])
+        sync = ParamSync(config_file)
+        path = "config/di-alpha/vpc.yaml"
+
+        with patch('sceptre_sync.param_sync.compile_glob', wraps=compile_glob) as compiler, \
+                patch('os.path.normcase', wraps=os.path.normcase) as normcase:
+            sync.get_sync_params(path)
+            sync.get_delete_params(path)
+            sync.should_sync_template(path)
+            sync.get_sync_rules(path)
+            assert compiler.call_count == 0
+            assert normcase.call_count == 1
+
+            sync.config = {'template_patterns': [{'pattern': '*/vpc.yaml', 'sync_params': ['Other']}]}
+            assert sync.get_sync_params(path) == ['Other']
+            assert compiler.call_count == 1
+
+    def test_pattern_prefilter_keeps_every_match(self):
+        """Test that the combined pattern only rules out paths matching nothing."""
+        sync = ParamSync()
+        sync.config = {'template_patterns': [
+            {'pattern': '*/vpc.yaml', 'sync_params': ['A']},
+            {'pattern': 'config/prod/*', 'sync_params': ['B']},
+            {'pattern': '*/rds-*.yaml', 'sync_params': ['C']},
+        ]}
+
+        assert sync.get_sync_params("config/prod/vpc.yaml") == ['A', 'B']
+        assert sync.get_sync_params("config/dev/rds-main.yaml") == ['C']
+        assert sync.get_sync_params("config/dev/ecs.yaml") == []
+
+    def test_repeated_pattern_entries_combine(self, temp_dir):
+        """Test that two template_patterns entries with the same pattern both apply."""
+        config_file = os.path.join(temp_dir, "config.yaml")
+        with open(config_file, 'w') as f:
+            f.write(
+                "template_patterns:\n"
+                "  - pattern: \"config/*/vpc-*.yaml\"\n"
+                "    sync_params: [VpcCidr]\n"
+                "  - pattern: \"config/*/vpc-*.yaml\"\n"
+                "    sync_params: [InstanceType]\n"
+            )
+
+        sync = ParamSync(config_file)
+
+        assert sync.get_sync_params("config/dev/vpc-main.yaml") == ['VpcCidr', 'InstanceType']
+        assert sync._any_pattern.pattern.count('vpc') == 1
+
     def test_load_config_file_not_found(self, temp_dir):
         """Test loading non-existent config file."""
         # This test verifies the actual error handling, not just SystemExit
@@ -117,7 +180,40 @@ class TestParamSync:
         data = {"template": {"path": "test.yaml"}}
         sync = ParamSync()
         assert sync.matches_filter(data, "template.missing:value") is False
-    
+
+    def test_compile_filter_is_reusable(self):
+        """Test that a compiled filter can be applied to many documents."""
+        sync = ParamSync()
+        matches = sync.compile_filter("template.path:enhanced,environment:!dev")
+
+        assert matches({"template": {"path": "enhanced.yaml"}, "environment": "prod"}) is True
+        assert matches({"template": {"path": "enhanced.yaml"}, "environment": "dev"}) is False
+        assert matches({"template": {"path": "standard.yaml"}}) is False
+        assert matches({"environment": "prod"}) is False
+
+    def test_filter_spec_is_parsed_once(self):
+        """Test that repeated matches_filter calls reuse the parsed filter spec."""
+        sync = ParamSync()
+        _parse_filter.cache_clear()
+
+        for environment in ("prod", "dev", "prod"):
+            sync.matches_filter({"environment": environment}, "environment:!dev")
+
+        assert _parse_filter.cache_info().misses == 1
+        assert _parse_filter("environment:!dev") == (
+            ("environment", ("environment",), "dev", True),
+        )
+
+    def test_filter_decisions_are_logged_not_printed(self, capsys, caplog):
+        """Test that filter tracing goes to the debug log instead of stdout."""
+        sync = ParamSync()
+
+        with caplog.at_level(logging.DEBUG, logger="sceptre_sync.param_sync"):
+            assert sync.matches_filter({"environment": "dev"}, "environment:prod") is False
+
+        assert capsys.readouterr().out == ""
+        assert "Filter no match: 'prod' not found in 'dev'" in caplog.messages
+
     def test_load_yaml_file(self, temp_dir, yaml_content):
         """Test loading YAML file."""
         yaml_file = os.path.join(temp_dir, "test.yaml")
@@ -129,6 +225,23 @@ class TestParamSync:
         
         assert 'parameters' in data
         assert data['parameters']['VpcCidr'] == "10.0.0.0/16"
+
+    @pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason="posix_fadvise unavailable")
+    def test_load_yaml_file_advises_sequential_read(self, temp_dir, monkeypatch):
+        """Test that every load hints sequential access and parses afresh."""
+        yaml_file = os.path.join(temp_dir, "test.yaml")
+        with open(yaml_file, 'w') as f:
+            f.write("parameters:\n  A: 1\n")
+        advice = []
+        monkeypatch.setattr(os, 'posix_fadvise', lambda fd, offset, length, flag: advice.append(flag))
+
+        sync = ParamSync()
+        first = sync.load_yaml_file(yaml_file)
+        first['parameters']['A'] = 99
+        second = sync.load_yaml_file(yaml_file)
+
+        assert advice == [os.POSIX_FADV_SEQUENTIAL] * 2
+        assert second['parameters']['A'] == 1
     
     def test_save_yaml_file(self, temp_dir, yaml_content):
         """Test saving YAML file."""
@@ -144,7 +257,32 @@ class TestParamSync:
         assert os.path.exists(yaml_file)
         loaded_data = sync.load_yaml_file(yaml_file)
         assert loaded_data['parameters']['VpcCidr'] == "10.0.0.0/16"
-    
+
+    def test_save_yaml_file_dump_error_keeps_original(self, temp_dir):
+        """Test that a failed dump does not truncate the existing file."""
+        yaml_file = os.path.join(temp_dir, "output.yaml")
+        Path(yaml_file).write_text("parameters:\n  A: 1\n")
+        sync = ParamSync()
+
+        with patch.object(sync.yaml, 'dump', side_effect=ValueError("boom")):
+            with pytest.raises(SystemExit):
+                sync.save_yaml_file(yaml_file, {'parameters': {'A': 2}})
+
+        assert Path(yaml_file).read_text() == "parameters:\n  A: 1\n"
+
+    def test_sync_into_comments_only_target_keeps_comments(self, temp_dir):
+        """Test that syncing into a comments-only file appends below the comments."""
+        source_file = os.path.join(temp_dir, "source.yaml")
+        target_file = os.path.join(temp_dir, "target.yaml")
+        Path(source_file).write_text("parameters:\n  A: 1\n")
+        Path(target_file).write_text("# Owned by the network team\n\n")
+
+        ParamSync().sync_parameters(source_file, target_file, ["A"], [], False)
+
+        assert Path(target_file).read_text() == (
+            "# Owned by the network team\nparameters:\n  A: 1\n"
+        )
+
     def test_generate_diff_parameters_added(self, sync_result_factory):
         """Test diff generation for added parameters."""
         sync = ParamSync()
@@ -239,6 +377,55 @@ class TestParamSync:
         assert diff['template']['old']['path'] == "old/path.yaml"
         assert diff['template']['new']['path'] == "new/path.yaml"
     
+    def test_generate_diff_compares_repeated_params_once(self):
+        """Test that a parameter requested by several patterns is compared once."""
+        sync = ParamSync()
+        source_data = {"parameters": {"B": "new", "A": "same"}}
+        target_data = {"parameters": {"B": "old", "A": "same", "C": "gone"}}
+
+        with patch('sceptre_sync.param_sync.values_differ', wraps=lambda a, b: a != b) as differ:
+            diff = sync.generate_diff(
+                source_data, target_data, ["B", "A", "B", "Missing"], ["C", "C"], False
+            )
+
+        assert differ.call_count == 2
+        assert list(diff['modified']) == ["B"]
+        assert list(diff['unchanged']) == ["A"]
+        assert diff['deleted'] == {"C": "gone"}
+
+    def test_generate_diff_nothing_requested(self):
+        """Test that an empty request returns the zero diff without reading the data."""
+        sync = ParamSync()
+        source_data = Mock()
+        target_data = Mock()
+
+        diff = sync.generate_diff(source_data, target_data, [], [], False)
+
+        assert diff == {
+            'added': {},
+            'modified': {},
+            'unchanged': {},
+            'deleted': {},
+            'template': None
+        }
+        assert not source_data.mock_calls
+        assert not target_data.mock_calls
+
+    def test_generate_diff_multi_skips_empty_rules(self):
+        """Test that a rule with nothing to sync or delete is not looked up."""
+        sync = ParamSync()
+        source_data = Mock()
+        target_data = Mock()
+
+        diff = sync.generate_diff_multi(source_data, target_data, [{'key': 'stack_tags'}])
+
+        assert diff == {
+            'stack_tags': {'added': {}, 'modified': {}, 'unchanged': {}, 'deleted': {}},
+            'template': None
+        }
+        assert not source_data.mock_calls
+        assert not target_data.mock_calls
+
     def test_sync_parameters_dry_run(self, temp_dir, yaml_content):
         """Test parameter synchronization in dry run mode."""
         # Create test files
@@ -361,9 +548,8 @@ class TestParamSync:
         source_template = {"type": "new_type"}
         target_template = {"type": "old_type"}
         
-        # This method doesn't exist yet - we're doing TDD!
-        # result = sync._compare_templates(source_template, target_template)
-        # assert result == {"old": target_template, "new": source_template}
+        result = sync._compare_templates(source_template, target_template)
+        assert result == {"old": target_template, "new": source_template}
     
     def test_compare_templates_structure_differs(self):
         """Test template comparison when structure differs."""
@@ -371,10 +557,24 @@ class TestParamSync:
         source_template = {"path": "path.yaml", "extra": "field"}
         target_template = {"path": "path.yaml"}
         
-        # This method doesn't exist yet - we're doing TDD!
-        # result = sync._compare_templates(source_template, target_template)
-        # assert result == {"old": target_template, "new": source_template}
+        result = sync._compare_templates(source_template, target_template)
+        assert result == {"old": target_template, "new": source_template}
     
+    @pytest.mark.parametrize("key_path, expected", [
+        ("stack_tags.Team", "core"),
+        ("stack_tags", {"Team": "core"}),
+        ("stack_tags.Missing", None),
+        ("empty.Team", None),
+        ("subnets.0", None),
+        ("name.first", None),
+    ])
+    def test_get_nested_value_paths(self, key_path, expected):
+        """Test nested lookups through mappings, gaps and non-mappings."""
+        data = {"stack_tags": {"Team": "core"}, "empty": None,
+                "subnets": ["a", "b"], "name": "vpc"}
+
+        assert ParamSync()._get_nested_value(data, key_path) == expected
+
     def test_diff_parameters_helper(self):
         """Test helper method for diffing parameters."""
         sync = ParamSync()
@@ -389,3 +589,165 @@ class TestParamSync:
         assert modified == {"B": {"old": "old", "new": "2"}}
         assert unchanged == {"A": "1"}
     
+
+    def test_apply_diff_matches_direct_sync(self, temp_dir):
+        """Test that a dry-run diff applied later gives the same result as a direct sync."""
+        config_file = os.path.join(temp_dir, "config.yaml")
+        with open(config_file, 'w') as f:
+            f.write("""
+template_patterns:
+  - pattern: "*.yaml"
+    sync_rules:
+      - key: parameters
+        sync_params: [VpcCidr, InstanceType]
+        delete_params: [Deprecated]
+        static_values:
+          Environment: prod
+""")
+        source = "parameters:\n  VpcCidr: 10.0.0.0/16\n  InstanceType: t3.large\n"
+        target = ("# keep me\nparameters:\n  VpcCidr: 10.1.0.0/16  # old\n"
+                  "  Deprecated: yes\n  Other: value\n")
+        paths = {}
+        for name in ("direct", "applied"):
+            os.makedirs(os.path.join(temp_dir, name))
+            paths[name] = (os.path.join(temp_dir, name, "source.yaml"),
+                           os.path.join(temp_dir, name, "target.yaml"))
+            Path(paths[name][0]).write_text(source)
+            Path(paths[name][1]).write_text(target)
+        sync = ParamSync(config_file)
+
+        direct_diff = sync.sync_parameters(*paths['direct'], dry_run=False)
+        dry_run_diff = sync.sync_parameters(*paths['applied'], dry_run=True)
+        assert Path(paths['applied'][1]).read_text() == target
+        sync.apply_diff(*paths['applied'], dry_run_diff)
+
+        assert dry_run_diff == direct_diff
+        assert Path(paths['applied'][1]).read_text() == Path(paths['direct'][1]).read_text()
+
+    def test_apply_diff_writes_the_values_it_was_given(self, temp_dir):
+        """Test that apply_diff writes the reviewed values, even if the source moved on."""
+        source_file = os.path.join(temp_dir, "source.yaml")
+        target_file = os.path.join(temp_dir, "target.yaml")
+        Path(source_file).write_text("parameters:\n  Size: large\n  Tier: web\n")
+        Path(target_file).write_text("parameters:\n  Size: small\n")
+        sync = ParamSync()
+
+        diff = sync.sync_parameters(source_file, target_file, ['Size', 'Tier'], [], dry_run=True)
+        Path(source_file).write_text("parameters:\n  Size: huge\n")
+        sync.apply_diff(source_file, target_file, diff)
+
+        assert Path(target_file).read_text() == "parameters:\n  Size: large\n  Tier: web\n"
+
+    def test_apply_diff_with_empty_diff_is_noop(self, source_target_files):
+        """Test that a filtered-out (empty) diff leaves the target untouched."""
+        source_file, target_file = source_target_files
+        before = Path(target_file).read_text()
+
+        ParamSync().apply_diff(source_file, target_file, {})
+
+        assert Path(target_file).read_text() == before
+
+    def test_apply_diff_reuses_documents_from_diff_files(self, temp_dir):
+        """Test that documents kept from diff_files are applied without re-reading."""
+        source_file = os.path.join(temp_dir, "source.yaml")
+        target_file = os.path.join(temp_dir, "target.yaml")
+        Path(source_file).write_text("parameters:\n  Size: large\n")
+        Path(target_file).write_text("# keep me\nparameters:\n  Size: small\n")
+        sync = ParamSync()
+
+        diff, documents = sync.diff_files(source_file, target_file, ['Size'], [])
+        with patch.object(sync, 'load_yaml_file') as load:
+            sync.apply_diff(source_file, target_file, diff, documents=documents)
+            load.assert_not_called()
+
+        assert Path(target_file).read_text() == "# keep me\nparameters:\n  Size: large\n"
+
+    def test_diff_files_without_sync_params_loads_nothing(self, temp_dir, capsys):
+        """Test that a pair with nothing configured to sync is never parsed."""
+        sync = ParamSync()
+
+        with patch.object(sync, 'load_yaml_file') as load:
+            diff, documents = sync.diff_files(
+                os.path.join(temp_dir, "source.yaml"), os.path.join(temp_dir, "target.yaml")
+            )
+
+        load.assert_not_called()
+        assert documents is None
+        assert not any(diff.values())
+        assert "No sync parameters defined" in capsys.readouterr().err
+
+    def test_diff_files_filtered_out_skips_target(self, temp_dir):
+        """Test that a source rejected by the filter does not parse its target."""
+        source_file = os.path.join(temp_dir, "source.yaml")
+        Path(source_file).write_text("environment: dev\nparameters:\n  Size: large\n")
+        sync = ParamSync()
+
+        with patch.object(sync, 'load_yaml_file', wraps=sync.load_yaml_file) as load:
+            diff, documents = sync.diff_files(
+                source_file, os.path.join(temp_dir, "missing.yaml"), ['Size'], [],
+                filter_spec="environment:prod"
+            )
+
+        assert [call.args[0] for call in load.call_args_list] == [source_file]
+        assert (diff, documents) == ({}, None)
+
+    def test_sync_parameters_batch_parses_source_once(self, temp_dir):
+        """Test that a batch sync loads the source once and syncs every target."""
+        source_file = os.path.join(temp_dir, "source.yaml")
+        Path(source_file).write_text("parameters:\n  Size: large\n  Tier: web\n")
+        target_files = []
+        for name in ("a", "b", "c"):
+            target_file = os.path.join(temp_dir, f"{name}.yaml")
+            Path(target_file).write_text(f"# {name}\nparameters:\n  Size: small\n")
+            target_files.append(target_file)
+        sync = ParamSync()
+
+        with patch.object(sync, 'load_yaml_file', wraps=sync.load_yaml_file) as load:
+            diffs = sync.sync_parameters_batch(source_file, target_files, ['Size', 'Tier'], [])
+        loaded = [call.args[0] for call in load.call_args_list]
+
+        assert loaded.count(source_file) == 1
+        assert list(diffs) == target_files
+        for name, target_file in zip(("a", "b", "c"), target_files):
+            assert diffs[target_file]['modified'] == {'Size': {'old': 'small', 'new': 'large'}}
+            assert Path(target_file).read_text() == (
+                f"# {name}\nparameters:\n  Size: large\n  Tier: web\n"
+            )
+
+    def test_sync_parameters_batch_narrows_params_to_source(self, temp_dir):
+        """Test that a batch only asks each target about parameters the source has."""
+        source_file = os.path.join(temp_dir, "source.yaml")
+        Path(source_file).write_text("parameters:\n  Size: large\n  Tier: web\n")
+        target_files = [os.path.join(temp_dir, f"{name}.yaml") for name in ("a", "b")]
+        for target_file in target_files:
+            Path(target_file).write_text("parameters:\n  Size: small\n")
+        sync = ParamSync()
+
+        with patch.object(sync, 'generate_diff', wraps=sync.generate_diff) as generate:
+            sync.sync_parameters_batch(
+                source_file, target_files, ['Tier', 'Missing', 'Size', 'Tier'], [], dry_run=True
+            )
+
+        assert [call.args[2] for call in generate.call_args_list] == [['Tier', 'Size']] * 2
+
+    def test_sync_parameters_batch_in_process_pool(self, temp_dir, capsys):
+        """Test that a pooled batch gives the same diffs, files and output order."""
+        source_file = os.path.join(temp_dir, "source.yaml")
+        Path(source_file).write_text("template:\n  path: enhanced.yaml\nparameters:\n  Size: large\n")
+        target_files = []
+        for i in range(5):
+            target_file = os.path.join(temp_dir, f"target-{i}.yaml")
+            Path(target_file).write_text(f"# target {i}\nparameters:\n  Size: small\n")
+            target_files.append(target_file)
+        sync = ParamSync()
+        sync.parallel_threshold = 1
+
+        diffs = sync.sync_parameters_batch(source_file, target_files + target_files[:1],
+                                           ['Size'], [], filter_spec="template.path:enhanced",
+                                           max_workers=2)
+
+        assert list(diffs) == target_files
+        for i, target_file in enumerate(target_files):
+            assert diffs[target_file]['modified'] == {'Size': {'old': 'small', 'new': 'large'}}
+            assert Path(target_file).read_text() == f"# target {i}\nparameters:\n  Size: large\n"
+        assert capsys.readouterr().out.count("matches filter template.path:enhanced") == 5
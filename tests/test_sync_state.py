@@ -0,0 +1,78 @@
+"""
+Tests for the persistent sync state.
+
+Because the fastest diff is the one you remember you don't need to do.
+"""
+
+import json
+import os
+
+from sceptre_sync.sync_state import STATE_VERSION, SyncState
+
+
+def touch_later(path):
+    """Change a file's mtime without waiting on filesystem timestamp resolution."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSyncState:
+    """Test recording and checking in-sync file pairs."""
+
+    def test_recorded_pair_is_current_after_reload(self, tmp_path):
+        """Test that a recorded pair survives a save and reload."""
+        source = tmp_path / "source.yaml"
+        target = tmp_path / "target.yaml"
+        source.write_text("a: 1")
+        target.write_text("a: 1")
+        state_file = str(tmp_path / "state.json")
+
+        state = SyncState(state_file)
+        assert not state.is_current(str(source), str(target), "sig")
+        state.record(str(source), str(target), "sig")
+        state.save()
+
+        reloaded = SyncState(state_file)
+        assert reloaded.is_current(str(source), str(target), "sig")
+        assert not reloaded.is_current(str(source), str(target), "other-sig")
+
+    def test_modified_file_is_not_current(self, tmp_path):
+        """Test that touching either file invalidates the entry."""
+        source = tmp_path / "source.yaml"
+        target = tmp_path / "target.yaml"
+        source.write_text("a: 1")
+        target.write_text("a: 1")
+
+        state = SyncState(str(tmp_path / "state.json"))
+        state.record(str(source), str(target), "sig")
+        touch_later(target)
+
+        assert not state.is_current(str(source), str(target), "sig")
+
+    def test_missing_file_is_never_current(self, tmp_path):
+        """Test that pairs with a missing file are neither recorded nor current."""
+        source = tmp_path / "source.yaml"
+        source.write_text("a: 1")
+        missing = str(tmp_path / "missing.yaml")
+
+        state = SyncState(str(tmp_path / "state.json"))
+        state.record(str(source), missing, "sig")
+
+        assert state.entries == {}
+        assert not state.is_current(str(source), missing, "sig")
+
+    def test_unreadable_or_stale_state_is_ignored(self, tmp_path):
+        """Test that corrupt or old-format state files start empty."""
+        state_file = tmp_path / "state.json"
+
+        state_file.write_text("{not json")
+        assert SyncState(str(state_file)).entries == {}
+
+        state_file.write_text(json.dumps({'version': STATE_VERSION - 1, 'entries': {'k': []}}))
+        assert SyncState(str(state_file)).entries == {}
+
+    def test_save_without_changes_writes_nothing(self, tmp_path):
+        """Test that a run that recorded nothing leaves no state file behind."""
+        state_file = tmp_path / "state.json"
+        SyncState(str(state_file)).save()
+        assert not state_file.exists()